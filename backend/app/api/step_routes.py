@@ -44,7 +44,12 @@ from app.models.schemas import (
 from app.services.ai_clients import ClaudeClient
 from app.services.pipeline import PipelineOrchestrator
 from app.services.slides_extractor import SlidesExtractor
-from app.utils import estimate_duration_from_text, get_media_duration, is_transcript_file
+from app.utils import (
+    estimate_duration_from_size,
+    estimate_duration_from_text,
+    get_media_duration,
+    is_transcript_file,
+)
 from app.services.progress_estimator import ProgressEstimator
 
 logger = logging.getLogger(__name__)
@@ -302,10 +307,10 @@ async def step_transcribe(request: StepParseRequest) -> StreamingResponse:
         )
 
     # Media file — transcribe via Whisper
-    duration = get_media_duration(video_path)
+    duration = await get_media_duration(video_path)
     if duration is None:
-        # Fallback: estimate from file size (~5MB per minute)
-        duration = video_path.stat().st_size / 83333
+        # Fallback: estimate from file size (same as ParseStage)
+        duration = estimate_duration_from_size(video_path)
 
     estimate = estimator.estimate_transcribe(duration)
 
@@ -24,6 +24,17 @@ class Settings(BaseSettings):
     whisper_language: str = "ru"
     whisper_include_timestamps: bool = False  # Include [HH:MM:SS] in transcript_raw.txt
     llm_timeout: int = 900  # v0.83+: 15min for Opus large single-pass (was 300)
+    # v0.86+: send all longread section prompts at once via generate_batch()
+    # (server-side scheduling, e.g. Ollama OLLAMA_NUM_PARALLEL); bounded by max_parallel_sections
+    enable_batch_inference: bool = False
+    # v0.86+: map-reduce longread with fewer words skips the intro/conclusion LLM call
+    # and builds them from section previews, leaving the longread unclassified (0 = always call LLM)
+    longread_min_words_for_frame: int = 0
+    # v0.86+: disk cache of longread LLM responses keyed by model + prompt (dev loop)
+    enable_prompt_cache: bool = False
+    outline_cache_size: int = 512  # v0.86+: in-memory LRU of part outlines (0 = disabled)
+    outline_max_parallel: int = 8  # v0.86+: max parallel outline LLM calls (adaptive on 429/503)
+    outline_batch_size: int = 1  # v0.86+: text parts per outline LLM call (prompt outline/map_batch)
 
     # Paths
     data_root: Path = Path("/data")
@@ -32,6 +43,7 @@ class Settings(BaseSettings):
     temp_dir: Path = Path("/data/temp")
     config_dir: Path = Path("/app/config")
     prompts_dir: Path | None = None  # External prompts directory (overrides built-in)
+    cache_dir: Path = Path("/data/cache")  # Prompt cache (enable_prompt_cache)
 
     # Logging
     log_level: str = "INFO"
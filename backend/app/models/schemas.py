@@ -10,7 +10,7 @@ from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
 
-from typing import Literal
+from typing import Iterator, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 from pydantic.alias_generators import to_camel
@@ -709,6 +709,27 @@ class Longread(CamelCaseModel):
         Returns:
             Full markdown document with YAML frontmatter.
         """
+        return "\n".join(self._iter_markdown_lines())
+
+    def stream_to_markdown(self, path: Path) -> None:
+        """Write longread markdown to file without building the full string.
+
+        Sections are written one by one, so peak memory stays at a single
+        section instead of the whole document. Output is identical to
+        to_markdown().
+
+        Args:
+            path: Target markdown file path
+        """
+        lines = self._iter_markdown_lines()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(next(lines))
+            for line in lines:
+                f.write("\n")
+                f.write(line)
+
+    def _iter_markdown_lines(self) -> Iterator[str]:
+        """Yield markdown lines: frontmatter, title, sections, conclusion."""
         lines = [
             "---",
             'type: "лонгрид"',
@@ -743,19 +764,19 @@ class Longread(CamelCaseModel):
             lines.append(self.introduction)
             lines.append("")
 
+        yield from lines
+
         for section in self.sections:
-            lines.append(f"## {section.title}")
-            lines.append("")
-            lines.append(section.content)
-            lines.append("")
+            yield f"## {section.title}"
+            yield ""
+            yield section.content
+            yield ""
 
         if self.conclusion:
-            lines.append("---")
-            lines.append("")
-            lines.append(self.conclusion)
-            lines.append("")
-
-        return "\n".join(lines)
+            yield "---"
+            yield ""
+            yield self.conclusion
+            yield ""
 
 
 class Summary(CamelCaseModel):
@@ -5,6 +5,7 @@ This package provides a unified interface for different AI services:
 - OllamaClient: Local Ollama LLM (text generation, chat)
 - ClaudeClient: Anthropic Claude API (cloud, large context)
 - WhisperClient: Whisper ASR for transcription (separate service)
+- CachedAIClient: Disk cache of generate() responses over any LLM client
 
 Usage:
     from app.services.ai_clients import OllamaClient, ClaudeClient, WhisperClient
@@ -33,6 +34,7 @@ from app.services.ai_clients.base import (
     ChatUsage,
     GenerationOptions,
 )
+from app.services.ai_clients.cached_client import CachedAIClient
 from app.services.ai_clients.claude_client import ClaudeClient
 from app.services.ai_clients.ollama_client import OllamaClient
 from app.services.ai_clients.whisper_client import WhisperClient
@@ -52,6 +54,7 @@ __all__ = [
     "OllamaClient",
     "ClaudeClient",
     "ChatUsage",
+    "CachedAIClient",
     # Transcription
     "WhisperClient",
 ]
@@ -5,10 +5,15 @@ Defines the interface that all AI clients must implement,
 allowing interchangeable use of Ollama, Claude, and future providers.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Protocol, runtime_checkable
 
+from app.utils.concurrency_utils import AdaptiveSemaphore, retry_on_rate_limit
+
 
 @dataclass
 class AIClientConfig:
@@ -55,17 +60,26 @@ class ChatUsage:
     For providers without usage tracking, returns zeros.
 
     Attributes:
-        input_tokens: Tokens in the input prompt
+        input_tokens: Uncached tokens in the input prompt
         output_tokens: Tokens generated in response
+        cache_write_tokens: Prompt tokens written to provider cache
+        cache_read_tokens: Prompt tokens served from provider cache
     """
 
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_read_tokens: int = 0
+
+    @property
+    def prompt_tokens(self) -> int:
+        """All prompt tokens, cached or not (comparable with uncached calls)."""
+        return self.input_tokens + self.cache_write_tokens + self.cache_read_tokens
 
     @property
     def total_tokens(self) -> int:
         """Total tokens used."""
-        return self.input_tokens + self.output_tokens
+        return self.prompt_tokens + self.output_tokens
 
 
 @runtime_checkable
@@ -98,6 +112,7 @@ class BaseAIClient(Protocol):
         prompt: str,
         model: str | None = None,
         num_predict: int | None = None,
+        cached_prefix: str | None = None,
     ) -> tuple[str, ChatUsage]:
         """
         Generate text from a prompt.
@@ -106,6 +121,9 @@ class BaseAIClient(Protocol):
             prompt: Text prompt for generation
             model: Model name (uses default if None)
             num_predict: Max tokens to generate (model default if None)
+            cached_prefix: Invariant prompt head shared by a series of calls.
+                Sent before prompt; providers with prompt caching reuse it
+                across calls instead of re-processing (v0.86+)
 
         Returns:
             Tuple of (generated_text, ChatUsage)
@@ -115,6 +133,57 @@ class BaseAIClient(Protocol):
         """
         ...
 
+    async def generate_batch(
+        self,
+        prompts: list[str],
+        model: str | None = None,
+        num_predict: int | None = None,
+        cached_prefix: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[tuple[str, ChatUsage]]:
+        """
+        Generate responses for several prompts in one batch (v0.86+).
+
+        Args:
+            prompts: Prompts to generate (same model and options)
+            model: Model name (uses default if None)
+            num_predict: Max tokens to generate per prompt
+            cached_prefix: Invariant prompt head shared by all prompts
+            max_concurrency: Max requests in flight (None = all at once)
+
+        Returns:
+            List of (generated_text, ChatUsage) in prompts order
+
+        Raises:
+            AIClientError: If any generation fails
+        """
+        ...
+
+    def generate_stream(
+        self,
+        prompt: str,
+        model: str | None = None,
+        num_predict: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate text as a stream of chunks (v0.86+).
+
+        Closing the iterator early (aclose) stops generation, so callers
+        can stop as soon as they have what they need.
+
+        Args:
+            prompt: Text prompt for generation
+            model: Model name (uses default if None)
+            num_predict: Max tokens to generate (model default if None)
+
+        Yields:
+            Generated text chunks
+
+        Raises:
+            AIClientError: If generation fails
+        """
+        ...
+
     async def chat(
         self,
         messages: list[dict],
@@ -248,10 +317,58 @@ class BaseAIClientImpl(ABC):
         prompt: str,
         model: str | None = None,
         num_predict: int | None = None,
+        cached_prefix: str | None = None,
     ) -> tuple[str, ChatUsage]:
         """Generate text from a prompt."""
         pass
 
+    async def generate_batch(
+        self,
+        prompts: list[str],
+        model: str | None = None,
+        num_predict: int | None = None,
+        cached_prefix: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[tuple[str, ChatUsage]]:
+        """
+        Generate responses for several prompts in one batch.
+
+        Default: requests are sent concurrently and the provider schedules
+        them (Ollama batches with OLLAMA_NUM_PARALLEL > 1). With
+        max_concurrency, at most that many are in flight: the limit halves
+        on rate limiting (429/503) and the prompt is retried with backoff.
+        Subclasses may override with a native batch endpoint.
+        """
+        limiter = AdaptiveSemaphore(max_concurrency or len(prompts) or 1)
+
+        async def generate_one(prompt: str) -> tuple[str, ChatUsage]:
+            call = partial(
+                self.generate,
+                prompt,
+                model=model,
+                num_predict=num_predict,
+                cached_prefix=cached_prefix,
+            )
+            async with limiter:
+                return await retry_on_rate_limit(call, limiter)
+
+        return list(await asyncio.gather(*(generate_one(p) for p in prompts)))
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: str | None = None,
+        num_predict: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate text as a stream of chunks.
+
+        Default: one chunk with the full generate() result.
+        Subclasses override with provider streaming.
+        """
+        text, _usage = await self.generate(prompt, model=model, num_predict=num_predict)
+        yield text
+
     @abstractmethod
     async def chat(
         self,
@@ -287,6 +404,8 @@ if __name__ == "__main__":
         # Test that BaseAIClientImpl is recognized as implementing Protocol
         # This is a compile-time check, but we verify the structure
         assert hasattr(BaseAIClientImpl, "generate")
+        assert hasattr(BaseAIClientImpl, "generate_batch")
+        assert hasattr(BaseAIClientImpl, "generate_stream")
         assert hasattr(BaseAIClientImpl, "chat")
         assert hasattr(BaseAIClientImpl, "close")
         assert hasattr(BaseAIClientImpl, "__aenter__")
@@ -306,4 +425,40 @@ if __name__ == "__main__":
 
         print("\nAll protocol tests passed!")
 
+    async def test_generate_batch_bounded():
+        """Default generate_batch respects max_concurrency and retries 429."""
+        print("Testing generate_batch concurrency...")
+
+        class _FakeClient(BaseAIClientImpl):
+            active = 0
+            peak = 0
+            rate_limited = False
+
+            async def generate(self, prompt, model=None, num_predict=None, cached_prefix=None):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                try:
+                    await asyncio.sleep(0.01)
+                    if prompt == "p3" and not self.rate_limited:
+                        self.rate_limited = True
+                        raise AIClientResponseError("busy", status_code=429)
+                    return prompt.upper(), ChatUsage(input_tokens=1)
+                finally:
+                    self.active -= 1
+
+            async def chat(self, messages, model=None, temperature=0.7, num_predict=None):
+                return "", ChatUsage()
+
+            async def close(self):
+                pass
+
+        client = _FakeClient(AIClientConfig(base_url=""))
+        prompts = [f"p{i}" for i in range(10)]
+        results = await client.generate_batch(prompts, max_concurrency=3)
+        assert [text for text, _ in results] == [p.upper() for p in prompts]
+        assert client.peak <= 3, f"peak {client.peak}"
+        assert client.rate_limited
+        print("  max_concurrency + 429 retry: OK")
+
     test_protocol_compliance()
+    asyncio.run(test_generate_batch_bounded())
@@ -0,0 +1,174 @@
+"""
+Response cache wrapper for LLM clients (v0.86+).
+
+Stores generate() responses on disk keyed by hash of model and prompt,
+so re-running a longread on the same text doesn't call the LLM again.
+Useful in the dev loop; disabled by default (Settings.enable_prompt_cache).
+
+Only generate() is cached: chat() is used for multi-turn flows where
+identical history does not imply identical expected answer.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from app.services.ai_clients.base import BaseAIClient, BaseAIClientImpl, ChatUsage
+
+logger = logging.getLogger(__name__)
+
+
+class CachedAIClient(BaseAIClientImpl):
+    """
+    Decorator over an AI client with file-based cache of generate() responses.
+
+    Cache hit returns zero ChatUsage: no tokens were spent.
+    The wrapped client is not owned: close() is a no-op.
+
+    Example:
+        client = CachedAIClient(ai_client, settings.cache_dir / "llm")
+        text, usage = await client.generate(prompt, model="gemma2:9b")
+    """
+
+    def __init__(self, client: BaseAIClient, cache_dir: Path):
+        """
+        Initialize cached client.
+
+        Args:
+            client: Wrapped AI client
+            cache_dir: Directory for cached responses (created on first write)
+        """
+        super().__init__(client.config)  # type: ignore[attr-defined]
+        self.client = client
+        self.cache_dir = cache_dir
+        # Callers keying their own caches by model see the wrapped default
+        self.default_model = getattr(client, "default_model", None)
+
+    @staticmethod
+    def _cache_key(
+        model: str | None,
+        prompt: str,
+        num_predict: int | None,
+        cached_prefix: str | None,
+    ) -> str:
+        """Hash of everything that affects the response."""
+        payload = "\0".join((
+            model or "",
+            str(num_predict or ""),
+            cached_prefix or "",
+            prompt,
+        ))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        num_predict: int | None = None,
+        cached_prefix: str | None = None,
+    ) -> tuple[str, ChatUsage]:
+        """Generate text, serving repeated prompts from disk cache."""
+        key = self._cache_key(model, prompt, num_predict, cached_prefix)
+        cache_path = self.cache_dir / f"{key}.json"
+
+        if cache_path.exists():
+            try:
+                data = json.loads(cache_path.read_text(encoding="utf-8"))
+                logger.debug("Prompt cache hit: %s", key)
+                return data["text"], ChatUsage()
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Broken prompt cache entry {cache_path.name}: {e}")
+
+        text, usage = await self.client.generate(
+            prompt,
+            model=model,
+            num_predict=num_predict,
+            cached_prefix=cached_prefix,
+        )
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"model": model, "text": text}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write prompt cache entry: {e}")
+
+        return text, usage
+
+    async def chat(
+        self,
+        messages: list[dict],
+        model: str | None = None,
+        temperature: float = 0.7,
+        num_predict: int | None = None,
+    ) -> tuple[str, ChatUsage]:
+        """Chat completion (not cached)."""
+        return await self.client.chat(
+            messages,
+            model=model,
+            temperature=temperature,
+            num_predict=num_predict,
+        )
+
+    async def close(self) -> None:
+        """Wrapped client is closed by its owner."""
+        pass
+
+
+if __name__ == "__main__":
+    """Run tests when executed directly."""
+    import asyncio
+    import sys
+    import tempfile
+
+    class _CountingClient(BaseAIClientImpl):
+        """Fake client counting generate() calls."""
+
+        calls = 0
+
+        async def generate(self, prompt, model=None, num_predict=None, cached_prefix=None):
+            self.calls += 1
+            return f"answer to {prompt}", ChatUsage(input_tokens=10, output_tokens=5)
+
+        async def chat(self, messages, model=None, temperature=0.7, num_predict=None):
+            return "chat", ChatUsage()
+
+        async def close(self):
+            pass
+
+    async def run_tests() -> int:
+        """Run CachedAIClient tests."""
+        from app.services.ai_clients.base import AIClientConfig
+
+        print("\nRunning CachedAIClient tests...\n")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            inner = _CountingClient(AIClientConfig(base_url=""))
+            client = CachedAIClient(inner, Path(tmp))
+
+            # Test 1: Miss then hit
+            print("Test 1: Miss then hit...", end=" ")
+            first = await client.generate("Привет", model="m")
+            second = await client.generate("Привет", model="m")
+            if inner.calls == 1 and first[0] == second[0] and second[1].total_tokens == 0:
+                print("OK")
+            else:
+                print(f"FAILED: calls={inner.calls}, {first}, {second}")
+                return 1
+
+            # Test 2: Different model is a different key
+            print("Test 2: Model is part of key...", end=" ")
+            await client.generate("Привет", model="other")
+            if inner.calls == 2:
+                print("OK")
+            else:
+                print(f"FAILED: calls={inner.calls}")
+                return 1
+
+        print("\nAll tests passed!")
+        return 0
+
+    sys.exit(asyncio.run(run_tests()))
@@ -126,16 +126,21 @@ class ClaudeClient(BaseAIClientImpl):
         prompt: str,
         model: str | None = None,
         num_predict: int | None = None,
+        cached_prefix: str | None = None,
     ) -> tuple[str, ChatUsage]:
         """
         Generate text using Claude API.
 
         Internally uses the messages API with a single user message.
+        With cached_prefix the message has two text blocks; the prefix block
+        carries cache_control, so repeated calls with the same prefix read
+        it from Anthropic prompt cache (5 min TTL).
 
         Args:
             prompt: Text prompt for generation
             model: Model name (default: claude-sonnet)
             num_predict: Max tokens to generate (default: 4096)
+            cached_prefix: Invariant prompt head to cache across calls
 
         Returns:
             Tuple of (generated_text, ChatUsage)
@@ -147,7 +152,19 @@ class ClaudeClient(BaseAIClientImpl):
             text, usage = await client.generate("Hello!")
             print(f"Used {usage.total_tokens} tokens")
         """
-        messages = [{"role": "user", "content": prompt}]
+        if cached_prefix:
+            content: str | list[dict] = [
+                {
+                    "type": "text",
+                    "text": cached_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+
+        messages = [{"role": "user", "content": content}]
         return await self.chat(
             messages=messages,
             model=model,
@@ -254,15 +271,24 @@ class ClaudeClient(BaseAIClientImpl):
 
             # Extract text and usage from response
             content = response.content[0].text
+            # Prompt cache tokens are billed at their own rates (calculate_cost)
+            cache_write = getattr(response.usage, "cache_creation_input_tokens", None) or 0
+            cache_read = getattr(response.usage, "cache_read_input_tokens", None) or 0
             usage = ChatUsage(
                 input_tokens=response.usage.input_tokens,
                 output_tokens=response.usage.output_tokens,
+                cache_write_tokens=cache_write,
+                cache_read_tokens=cache_read,
             )
 
             stop_reason = response.stop_reason
+            cache_str = (
+                f" (cache write {cache_write} / read {cache_read})"
+                if cache_write or cache_read else ""
+            )
             logger.info(
                 f"Claude response: {len(content)} chars, "
-                f"tokens: {usage.input_tokens} in / {usage.output_tokens} out, "
+                f"tokens: {usage.input_tokens} in{cache_str} / {usage.output_tokens} out, "
                 f"stop={stop_reason}"
             )
 
@@ -10,7 +10,9 @@ Note: Ollama doesn't provide token usage, so ChatUsage(0, 0) is returned.
 Note: Whisper transcription is handled by separate WhisperClient.
 """
 
+import json
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 from tenacity import (
@@ -20,7 +22,7 @@ from tenacity import (
     wait_exponential,
 )
 
-from app.config import Settings
+from app.config import Settings, get_model_config
 from app.services.ai_clients.base import (
     AIClientConfig,
     AIClientConnectionError,
@@ -39,6 +41,20 @@ RETRY_DECORATOR = retry(
     retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException)),
 )
 
+# Connection pool: one client serves all parallel section/part requests of a stage.
+# Keep-alive outlives the gap between sequential LLM calls (outline -> sections -> frame)
+# so remote Ollama doesn't pay a new TCP handshake per call.
+POOL_MAX_CONNECTIONS = 8  # without settings (from_settings sizes it by parallelism)
+POOL_KEEPALIVE_EXPIRY = 120.0  # seconds
+# Same fallback as LongreadGenerator's DEFAULT_MAX_PARALLEL_SECTIONS
+# (not imported: longread_generator depends on ai_clients)
+DEFAULT_MAX_PARALLEL_SECTIONS = 2
+
+
+def _json_string_body(text: str) -> bytes:
+    """JSON-escaped UTF-8 string content without surrounding quotes."""
+    return json.dumps(text, ensure_ascii=False)[1:-1].encode("utf-8")
+
 
 class OllamaClient(BaseAIClientImpl):
     """
@@ -58,6 +74,7 @@ class OllamaClient(BaseAIClientImpl):
         config: AIClientConfig,
         default_model: str = "gemma2:9b",
         llm_timeout: float = 300.0,
+        max_connections: int = POOL_MAX_CONNECTIONS,
     ):
         """
         Initialize Ollama client.
@@ -66,19 +83,35 @@ class OllamaClient(BaseAIClientImpl):
             config: AI client configuration with Ollama URL
             default_model: Default model for generation
             llm_timeout: Timeout for LLM requests in seconds
+            max_connections: Connection pool size (concurrent requests)
         """
         super().__init__(config)
         self.default_model = default_model
         self.llm_timeout = llm_timeout
 
         # No global timeout - each request sets its own timeout explicitly
-        self.http_client = httpx.AsyncClient(timeout=None)
+        self.http_client = httpx.AsyncClient(
+            timeout=None,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+        # Last cached_prefix and its JSON-escaped UTF-8 form: all section
+        # requests of one video share it instead of re-encoding per call
+        self._prefix_encoded: tuple[str, bytes] = ("", b"")
 
     @classmethod
     def from_settings(cls, settings: Settings) -> "OllamaClient":
         """
         Create OllamaClient from application settings.
 
+        Pool size is the widest parallel stage: longread sections
+        (max_parallel_sections of the longread model) or outline parts
+        (outline_max_parallel).
+
         Args:
             settings: Application settings
 
@@ -89,10 +122,15 @@ class OllamaClient(BaseAIClientImpl):
             base_url=settings.ollama_url,
             timeout=settings.llm_timeout,
         )
+        longread_config = get_model_config(settings.longread_model, settings).get("longread", {})
+        max_parallel_sections = longread_config.get(
+            "max_parallel_sections", DEFAULT_MAX_PARALLEL_SECTIONS
+        )
         return cls(
             config=config,
             default_model=settings.summarizer_model,
             llm_timeout=settings.llm_timeout,
+            max_connections=max(max_parallel_sections, settings.outline_max_parallel),
         )
 
     async def close(self) -> None:
@@ -137,6 +175,7 @@ class OllamaClient(BaseAIClientImpl):
         prompt: str,
         model: str | None = None,
         num_predict: int | None = None,
+        cached_prefix: str | None = None,
     ) -> tuple[str, ChatUsage]:
         """
         Generate text using Ollama /api/generate endpoint.
@@ -145,6 +184,8 @@ class OllamaClient(BaseAIClientImpl):
             prompt: Text prompt for generation
             model: Model name (default: from settings)
             num_predict: Max tokens to generate (default: None = model default)
+            cached_prefix: Invariant prompt head, prepended to prompt.
+                Ollama reuses KV cache for a common prefix automatically.
 
         Returns:
             Tuple of (generated_text, ChatUsage).
@@ -156,22 +197,37 @@ class OllamaClient(BaseAIClientImpl):
         if model is None:
             model = self.default_model
 
-        logger.debug(f"Generating with {model}, prompt length: {len(prompt)}")
+        prompt_length = len(prompt) + len(cached_prefix or "")
+        logger.debug(f"Generating with {model}, prompt length: {prompt_length}")
 
         request_body: dict = {
             "model": model,
-            "prompt": prompt,
             "stream": False,
         }
 
         if num_predict is not None:
             request_body["options"] = {"num_predict": num_predict}
 
+        if cached_prefix:
+            # Body is sent as parts: shared prefix bytes are not copied
+            # into a per-request prompt string
+            body_parts = self._build_body_parts(request_body, cached_prefix, prompt)
+            request_kwargs: dict = {
+                "content": self._iter_body(body_parts),
+                "headers": {
+                    "Content-Type": "application/json",
+                    "Content-Length": str(sum(len(part) for part in body_parts)),
+                },
+            }
+        else:
+            request_body["prompt"] = prompt
+            request_kwargs = {"json": request_body}
+
         try:
             response = await self.http_client.post(
                 f"{self.config.base_url}/api/generate",
-                json=request_body,
                 timeout=self.llm_timeout,
+                **request_kwargs,
             )
 
             response.raise_for_status()
@@ -183,7 +239,7 @@ class OllamaClient(BaseAIClientImpl):
             if not response_text.strip():
                 logger.error(
                     f"Empty response from LLM! Model: {model}, "
-                    f"prompt_length: {len(prompt)} chars"
+                    f"prompt_length: {prompt_length} chars"
                 )
 
             logger.debug(f"Generated {len(response_text)} chars")
@@ -218,6 +274,134 @@ class OllamaClient(BaseAIClientImpl):
                 original_error=e,
             ) from e
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: str | None = None,
+        num_predict: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate text using Ollama /api/generate with stream=true.
+
+        Closing the iterator closes the HTTP response, and Ollama stops
+        generation when the client disconnects. Opening the stream is
+        retried like generate(); once a chunk is yielded, errors are not.
+
+        Args:
+            prompt: Text prompt for generation
+            model: Model name (default: from settings)
+            num_predict: Max tokens to generate (default: None = model default)
+
+        Yields:
+            Generated text chunks (NDJSON "response" fields)
+
+        Raises:
+            AIClientError: If generation fails
+        """
+        if model is None:
+            model = self.default_model
+
+        request_body: dict = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+        }
+
+        if num_predict is not None:
+            request_body["options"] = {"num_predict": num_predict}
+
+        try:
+            response = await self._open_stream(request_body)
+            try:
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if data.get("response"):
+                        yield data["response"]
+                    if data.get("done"):
+                        break
+            finally:
+                await response.aclose()
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Streaming generation timeout with {model}: {e}")
+            raise AIClientTimeoutError(
+                "Generation timeout",
+                provider="ollama",
+                model=model,
+                original_error=e,
+            ) from e
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Streaming generation HTTP error: {e.response.status_code}")
+            raise AIClientResponseError(
+                f"Generation failed: HTTP {e.response.status_code}",
+                provider="ollama",
+                model=model,
+                status_code=e.response.status_code,
+                response_body=e.response.text[:500],
+                original_error=e,
+            ) from e
+
+        except httpx.ConnectError as e:
+            logger.error(f"Cannot connect to Ollama: {e}")
+            raise AIClientConnectionError(
+                f"Cannot connect to Ollama at {self.config.base_url}",
+                provider="ollama",
+                original_error=e,
+            ) from e
+
+    @RETRY_DECORATOR
+    async def _open_stream(self, request_body: dict) -> httpx.Response:
+        """
+        Send streaming /api/generate request and return the open response.
+
+        Raises:
+            httpx.HTTPStatusError: Error status (body is read, response closed)
+        """
+        request = self.http_client.build_request(
+            "POST",
+            f"{self.config.base_url}/api/generate",
+            json=request_body,
+            timeout=self.llm_timeout,
+        )
+        response = await self.http_client.send(request, stream=True)
+        if response.is_error:
+            await response.aread()
+            await response.aclose()
+        response.raise_for_status()
+        return response
+
+    def _build_body_parts(
+        self,
+        request_body: dict,
+        cached_prefix: str,
+        prompt: str,
+    ) -> list[bytes]:
+        """
+        Split /api/generate JSON body into parts around the prompt.
+
+        JSON string escaping is per character, so escaped prefix and
+        escaped prompt concatenated form one valid "prompt" value.
+        """
+        if self._prefix_encoded[0] != cached_prefix:
+            self._prefix_encoded = (cached_prefix, _json_string_body(cached_prefix))
+
+        head = json.dumps(request_body, ensure_ascii=False)[:-1] + ', "prompt": "'
+        return [
+            head.encode("utf-8"),
+            self._prefix_encoded[1],
+            _json_string_body(prompt),
+            b'"}',
+        ]
+
+    @staticmethod
+    async def _iter_body(parts: list[bytes]) -> AsyncIterator[bytes]:
+        """Stream request body parts to the socket."""
+        for part in parts:
+            yield part
+
     @RETRY_DECORATOR
     async def chat(
         self,
@@ -369,6 +553,55 @@ if __name__ == "__main__":
             else:
                 print("SKIPPED (Ollama unavailable)")
 
+        # Test 4: Failed stream open is retried before the first chunk
+        print("\nTest 4: Stream open retry...", end=" ")
+        try:
+            attempts = 0
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                nonlocal attempts
+                attempts += 1
+                if attempts == 1:
+                    raise httpx.ConnectError("refused", request=request)
+                lines = [{"response": "При"}, {"response": "вет"}, {"done": True}]
+                body = "\n".join(json.dumps(line) for line in lines)
+                return httpx.Response(200, content=body.encode("utf-8"))
+
+            stream_client = OllamaClient(AIClientConfig(base_url="http://ollama.test"))
+            await stream_client.http_client.aclose()
+            stream_client.http_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            saved_wait = OllamaClient._open_stream.retry.wait
+            OllamaClient._open_stream.retry.wait = wait_exponential(max=0)
+            try:
+                chunks = [chunk async for chunk in stream_client.generate_stream("Привет")]
+            finally:
+                OllamaClient._open_stream.retry.wait = saved_wait
+                await stream_client.close()
+            assert chunks == ["При", "вет"], chunks
+            assert attempts == 2, attempts
+            print("OK")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
+        # Test 5: Pool is sized by the widest parallel stage
+        print("\nTest 5: Pool size from settings...", end=" ")
+        try:
+            sized = settings.model_copy(update={"outline_max_parallel": 1})
+            pool_client = OllamaClient.from_settings(sized)
+            pool = pool_client.http_client._transport._pool
+            await pool_client.close()
+            longread_config = get_model_config(sized.longread_model, sized).get("longread", {})
+            expected = longread_config.get("max_parallel_sections", DEFAULT_MAX_PARALLEL_SECTIONS)
+            assert pool._max_connections == expected, (pool._max_connections, expected)
+            print("OK")
+            print(f"  Connections: {pool._max_connections}")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
         print("\n" + "=" * 40)
         print("All tests passed!")
         return 0
@@ -31,7 +31,7 @@ from app.models.schemas import (
     TranscriptOutline,
     VideoMetadata,
 )
-from app.services.ai_clients import BaseAIClient
+from app.services.ai_clients import BaseAIClient, CachedAIClient, ChatUsage
 from app.services.outline_extractor import OutlineExtractor
 from app.services.text_splitter import TextSplitter, PART_SIZE, OVERLAP_SIZE, MIN_PART_SIZE
 from app.utils.language_utils import build_language_context
@@ -41,19 +41,19 @@ logger = logging.getLogger(__name__)
 perf_logger = logging.getLogger("app.perf")
 
 # Valid topic_area values for classification
-VALID_TOPIC_AREAS = [
+VALID_TOPIC_AREAS = frozenset({
     "продажи", "спонсорство", "лидерство",
-    "мотивация", "инструменты", "маркетинг-план"
-]
+    "мотивация", "инструменты", "маркетинг-план",
+})
 
 # Valid access_level values
-VALID_ACCESS_LEVELS = ["consultant", "leader", "personal"]
+VALID_ACCESS_LEVELS = frozenset({"consultant", "leader", "personal"})
 
-# Russian month names for date formatting
-RUSSIAN_MONTHS = [
-    "", "января", "февраля", "марта", "апреля", "мая", "июня",
-    "июля", "августа", "сентября", "октября", "ноября", "декабря"
-]
+# Russian month names for date formatting (index: month - 1)
+RUSSIAN_MONTHS: tuple[str, ...] = (
+    "января", "февраля", "марта", "апреля", "мая", "июня",
+    "июля", "августа", "сентября", "октября", "ноября", "декабря",
+)
 
 # Default configuration
 DEFAULT_PARTS_PER_SECTION = 2  # Text parts per section (was chunks_per_section)
@@ -77,6 +77,10 @@ CONTEXT_UTILIZATION = 0.90
 # Typical longread: 4000-8000 words ≈ 10K-20K tokens in Russian
 SINGLE_PASS_MAX_TOKENS = 16384
 
+# Section text above this size is formatted in a worker thread
+# so string building doesn't block the event loop
+FORMAT_IN_THREAD_CHARS = 50_000
+
 
 class LongreadGenerator:
     """
@@ -108,6 +112,9 @@ class LongreadGenerator:
             settings: Application settings
             prompt_overrides: Optional prompt file overrides (v0.32+)
         """
+        # v0.86+: re-runs on the same text are served from disk cache
+        if settings.enable_prompt_cache:
+            ai_client = CachedAIClient(ai_client, settings.cache_dir / "llm")
         self.ai_client = ai_client
         self.settings = settings
 
@@ -130,6 +137,8 @@ class LongreadGenerator:
         # Token tracking (v0.43+: unified interface)
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._total_cache_write_tokens = 0
+        self._total_cache_read_tokens = 0
         self._tokens_lock = asyncio.Lock()
 
         # Get model-specific config (v0.67+: uses longread_model, not summarizer_model)
@@ -148,11 +157,13 @@ class LongreadGenerator:
             "large_text_threshold", DEFAULT_LARGE_TEXT_THRESHOLD
         )
         self.max_input_chars = longread_config.get("max_input_chars", 0)
+        # Token budget for text parts of one section (0 = group by parts_per_section only)
+        self.target_section_tokens = longread_config.get("target_section_tokens", 0)
 
         logger.debug(
-            f"LongreadGenerator config: context_tokens={self.context_tokens}, "
-            f"parts_per_section={self.parts_per_section}, "
-            f"max_parallel={self.max_parallel}"
+            "LongreadGenerator config: context_tokens=%d, "
+            "parts_per_section=%d, max_parallel=%d",
+            self.context_tokens, self.parts_per_section, self.max_parallel,
         )
 
     async def generate(
@@ -179,6 +190,8 @@ class LongreadGenerator:
         # Reset token counters
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._total_cache_write_tokens = 0
+        self._total_cache_read_tokens = 0
 
         # Prepare full text with optional slides
         full_text = self._prepare_text(cleaned_transcript.text, slides_text)
@@ -201,20 +214,21 @@ class LongreadGenerator:
 
         elapsed = time.time() - start_time
 
-        cost_str = f"cost=${longread.cost:.4f} | " if longread.cost else ""
         logger.info(
-            f"Longread complete: {longread.total_sections} sections, "
-            f"{longread.total_word_count} words, {elapsed:.1f}s"
+            "Longread complete: %d sections, %d words, %.1fs",
+            longread.total_sections, longread.total_word_count, elapsed,
         )
 
-        perf_logger.info(
-            f"PERF | longread | "
-            f"chars={input_chars} | "
-            f"sections={longread.total_sections} | "
-            f"words={longread.total_word_count} | "
-            f"tokens={self._total_input_tokens}+{self._total_output_tokens} | "
-            f"{cost_str}time={elapsed:.1f}s"
-        )
+        if perf_logger.isEnabledFor(logging.INFO):
+            cost_str = f"cost=${longread.cost:.4f} | " if longread.cost else ""
+            perf_logger.info(
+                f"PERF | longread | "
+                f"chars={input_chars} | "
+                f"sections={longread.total_sections} | "
+                f"words={longread.total_word_count} | "
+                f"tokens={self._prompt_tokens()}+{self._total_output_tokens} | "
+                f"{cost_str}time={elapsed:.1f}s"
+            )
 
         return longread
 
@@ -276,16 +290,13 @@ class LongreadGenerator:
             model=self.settings.longread_model,
             num_predict=SINGLE_PASS_MAX_TOKENS,
         )
-        self._total_input_tokens = usage.input_tokens
-        self._total_output_tokens = usage.output_tokens
+        self._count_usage(usage)
 
         data = self._parse_json_response(response)
         elapsed = time.time() - start_time
 
         return self._build_longread(
             data, metadata,
-            tokens_input=self._total_input_tokens,
-            tokens_output=self._total_output_tokens,
             elapsed=elapsed,
         )
 
@@ -296,7 +307,7 @@ class LongreadGenerator:
     ) -> str:
         """Build prompt for single-pass generation."""
         date_formatted = (
-            f"{metadata.date.day} {RUSSIAN_MONTHS[metadata.date.month]} "
+            f"{metadata.date.day} {RUSSIAN_MONTHS[metadata.date.month - 1]} "
             f"{metadata.date.year}"
         )
 
@@ -408,12 +419,11 @@ class LongreadGenerator:
             "topic_area": classification.get("topic_area", []),
             "tags": classification.get("tags", []),
             "access_level": classification.get("access_level", "consultant"),
+            "unclassified": classification.get("unclassified", False),
         }
 
         return self._build_longread(
             data, metadata,
-            tokens_input=self._total_input_tokens,
-            tokens_output=self._total_output_tokens,
             elapsed=elapsed,
         )
 
@@ -426,7 +436,7 @@ class LongreadGenerator:
         input_chars = len(cleaned.text)
 
         if input_chars <= self.large_text_threshold:
-            logger.debug(f"Small text ({input_chars} chars), skipping outline extraction")
+            logger.debug("Small text (%d chars), skipping outline extraction", input_chars)
             return None
 
         logger.info(
@@ -449,7 +459,13 @@ class LongreadGenerator:
         metadata: VideoMetadata,
         outline_context: str,
     ) -> list[LongreadSection]:
-        """Generate sections in parallel using semaphore for rate limiting."""
+        """
+        Generate sections in parallel with a sliding window of max_parallel.
+
+        A fixed pool of workers pulls the next group as soon as one finishes,
+        so only max_parallel section coroutines exist at any time and a slow
+        section doesn't block scheduling of the rest.
+        """
         part_groups = self._group_parts(text_parts)
         total_sections = len(part_groups)
 
@@ -458,71 +474,150 @@ class LongreadGenerator:
             f"(max {self.max_parallel} parallel)"
         )
 
-        semaphore = asyncio.Semaphore(self.max_parallel)
+        # Rendered once per video: identical prefix lets the provider
+        # serve it from prompt cache for every section call. Passed explicitly
+        # (not stored on self) so concurrent generate() calls can't mix videos
+        prefix = self._build_section_prefix(metadata, outline_context)
 
-        async def generate_with_semaphore(
-            section_idx: int, part_group: list[TextPart]
-        ) -> LongreadSection:
-            async with semaphore:
-                return await self._generate_section(
-                    section_idx=section_idx + 1,
+        if self.settings.enable_batch_inference and total_sections > 1:
+            return await self._generate_sections_batch(part_groups, prefix)
+
+        sections: list[LongreadSection | None] = [None] * total_sections
+        pending = iter(enumerate(part_groups))
+
+        async def worker() -> None:
+            # Shared iterator: each free worker takes the next group in order
+            for idx, part_group in pending:
+                sections[idx] = await self._generate_section(
+                    section_idx=idx + 1,
                     total_sections=total_sections,
                     parts=part_group,
-                    metadata=metadata,
-                    outline_context=outline_context,
+                    prefix=prefix,
                 )
 
-        tasks = [
-            generate_with_semaphore(idx, group)
-            for idx, group in enumerate(part_groups)
-        ]
-        sections = await asyncio.gather(*tasks)
+        # TaskGroup cancels remaining workers on first failure instead of
+        # waiting for all sections (gather), freeing LLM slots immediately
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(min(self.max_parallel, total_sections)):
+                    tg.create_task(worker())
+        except ExceptionGroup as eg:
+            # Callers (LongreadStage) expect the original section error
+            raise eg.exceptions[0] from eg
 
-        return list(sections)
+        return sections  # type: ignore[return-value]  # all slots filled
 
     def _group_parts(self, text_parts: list[TextPart]) -> list[list[TextPart]]:
-        """Group text parts into sections."""
+        """
+        Group text parts into sections.
+
+        Without token budget: fixed parts_per_section per group.
+        With target_section_tokens: greedy packing while the estimated
+        tokens of the group stay within budget (parts_per_section is
+        still the upper bound). A single oversized part forms its own group.
+        """
+        if not self.target_section_tokens:
+            step = self.parts_per_section
+            return [text_parts[i:i + step] for i in range(0, len(text_parts), step)]
+
         groups: list[list[TextPart]] = []
         current_group: list[TextPart] = []
+        current_tokens = 0.0
 
         for part in text_parts:
+            part_tokens = len(part.text) * TOKENS_PER_CHAR_RU
+            if current_group and current_tokens + part_tokens > self.target_section_tokens:
+                groups.append(current_group)
+                current_group = []
+                current_tokens = 0.0
+
             current_group.append(part)
+            current_tokens += part_tokens
 
             if len(current_group) >= self.parts_per_section:
                 groups.append(current_group)
                 current_group = []
+                current_tokens = 0.0
 
         if current_group:
             groups.append(current_group)
 
         return groups
 
+    async def _generate_sections_batch(
+        self,
+        part_groups: list[list[TextPart]],
+        prefix: str,
+    ) -> list[LongreadSection]:
+        """
+        Generate all sections with one generate_batch() call.
+
+        The provider schedules section prompts itself (e.g. Ollama with
+        OLLAMA_NUM_PARALLEL), sharing the KV cache of the common prefix.
+        At most max_parallel requests are in flight, so rate-limited
+        cloud providers are not flooded on long transcripts.
+        """
+        total_sections = len(part_groups)
+        prompts = [
+            self._build_section_prompt(
+                idx + 1, total_sections, await self._format_parts_async(group)
+            )
+            for idx, group in enumerate(part_groups)
+        ]
+
+        logger.info(f"Batch inference: {total_sections} section prompts in one batch")
+
+        results = await self.ai_client.generate_batch(
+            prompts,
+            model=self.settings.longread_model,
+            num_predict=SINGLE_PASS_MAX_TOKENS,
+            cached_prefix=prefix,
+            max_concurrency=self.max_parallel,
+        )
+
+        sections = []
+        for idx, (group, (response, usage)) in enumerate(zip(part_groups, results)):
+            self._count_usage(usage)
+            sections.append(self._build_section(idx + 1, group, response))
+        return sections
+
     async def _generate_section(
         self,
         section_idx: int,
         total_sections: int,
         parts: list[TextPart],
-        metadata: VideoMetadata,
-        outline_context: str,
+        prefix: str,
     ) -> LongreadSection:
-        """Generate a single section from a group of text parts."""
-        logger.debug(f"Generating section {section_idx}/{total_sections}")
+        """
+        Generate a single section from a group of text parts.
 
-        parts_text = self._format_parts(parts)
+        prefix is the pre-rendered invariant head from _build_section_prefix();
+        only the per-section tail is built here.
+        """
+        logger.debug("Generating section %d/%d", section_idx, total_sections)
 
-        prompt = self._build_section_prompt(
-            section_idx, total_sections, parts_text, metadata, outline_context
-        )
+        parts_text = await self._format_parts_async(parts)
+
+        prompt = self._build_section_prompt(section_idx, total_sections, parts_text)
 
         response, usage = await self.ai_client.generate(
             prompt,
             model=self.settings.longread_model,
             num_predict=SINGLE_PASS_MAX_TOKENS,
+            cached_prefix=prefix,
         )
         async with self._tokens_lock:
-            self._total_input_tokens += usage.input_tokens
-            self._total_output_tokens += usage.output_tokens
+            self._count_usage(usage)
+
+        return self._build_section(section_idx, parts, response)
 
+    def _build_section(
+        self,
+        section_idx: int,
+        parts: list[TextPart],
+        response: str,
+    ) -> LongreadSection:
+        """Build LongreadSection from LLM response for a group of parts."""
         section_data = self._parse_json_response(response)
         source_indices = [p.index for p in parts]
 
@@ -534,15 +629,17 @@ class LongreadGenerator:
             word_count=section_data.get("word_count", 0),
         )
 
-    def _build_section_prompt(
+    def _build_section_prefix(
         self,
-        section_idx: int,
-        total_sections: int,
-        parts_text: str,
         metadata: VideoMetadata,
         outline_context: str,
     ) -> str:
-        """Build section generation prompt with system + instructions + template."""
+        """
+        Build invariant head of section prompts: system + instructions + video context.
+
+        Same for all sections of one video, passed as cached_prefix.
+        Ends with a blank line so that prefix + suffix reads as one prompt.
+        """
         prompt_parts = [
             self.system_prompt,
             "",
@@ -554,8 +651,6 @@ class LongreadGenerator:
             "",
             "## Задание",
             "",
-            f"Создай раздел {section_idx} из {total_sections} для лонгрида.",
-            "",
             f"**Спикер:** {metadata.speaker}",
             f"**Тема:** {metadata.title}",
             *build_speaker_context(metadata.speaker_info, metadata.speaker),
@@ -565,6 +660,20 @@ class LongreadGenerator:
             "",
             outline_context,
             "",
+            "",
+        ]
+        return "\n".join(prompt_parts)
+
+    def _build_section_prompt(
+        self,
+        section_idx: int,
+        total_sections: int,
+        parts_text: str,
+    ) -> str:
+        """Build per-section part of the prompt (appended after section prefix)."""
+        prompt_parts = [
+            f"Создай раздел {section_idx} из {total_sections} для лонгрида.",
+            "",
             "### Текст для обработки",
             "",
             parts_text,
@@ -584,13 +693,15 @@ class LongreadGenerator:
 
     def _format_parts(self, parts: list[TextPart]) -> str:
         """Format text parts for inclusion in prompt."""
-        lines = []
-        for part in parts:
-            lines.append(f"### Часть {part.index}")
-            lines.append("")
-            lines.append(part.text)
-            lines.append("")
-        return "\n".join(lines)
+        return "\n".join(
+            f"### Часть {part.index}\n\n{part.text}\n" for part in parts
+        )
+
+    async def _format_parts_async(self, parts: list[TextPart]) -> str:
+        """Format parts, in a worker thread for large groups."""
+        if sum(len(part.text) for part in parts) > FORMAT_IN_THREAD_CHARS:
+            return await asyncio.to_thread(self._format_parts, parts)
+        return self._format_parts(parts)
 
     async def _generate_frame(
         self,
@@ -598,10 +709,14 @@ class LongreadGenerator:
         metadata: VideoMetadata,
     ) -> tuple[str, str, dict[str, Any]]:
         """Generate introduction and conclusion from section summaries."""
+        min_words = self.settings.longread_min_words_for_frame
+        if min_words and sum(section.word_count for section in sections) < min_words:
+            return self._heuristic_frame(sections)
+
         logger.debug("Generating introduction and conclusion")
 
         sections_summary = self._build_sections_summary(sections)
-        date_formatted = f"{metadata.date.day} {RUSSIAN_MONTHS[metadata.date.month]} {metadata.date.year}"
+        date_formatted = f"{metadata.date.day} {RUSSIAN_MONTHS[metadata.date.month - 1]} {metadata.date.year}"
 
         prompt = self._build_frame_prompt(sections_summary, metadata, date_formatted)
 
@@ -611,8 +726,7 @@ class LongreadGenerator:
             num_predict=SINGLE_PASS_MAX_TOKENS,
         )
         async with self._tokens_lock:
-            self._total_input_tokens += usage.input_tokens
-            self._total_output_tokens += usage.output_tokens
+            self._count_usage(usage)
 
         data = self._parse_json_response(response)
 
@@ -628,6 +742,34 @@ class LongreadGenerator:
             classification,
         )
 
+    def _heuristic_frame(
+        self,
+        sections: list[LongreadSection],
+    ) -> tuple[str, str, dict[str, Any]]:
+        """
+        Build intro and conclusion without LLM for short longreads.
+
+        Saves one LLM round-trip: intro is a preview of the first section,
+        conclusion of the last one. Classification comes from the same LLM
+        call, so the longread is marked unclassified instead of getting
+        made-up topic_area and tags.
+        """
+        logger.info(
+            "Short longread (%d sections), frame built from section previews without LLM",
+            len(sections),
+        )
+        classification = {"unclassified": True}
+        if not sections:
+            return "", "", classification
+
+        def preview(section: LongreadSection) -> str:
+            # Short section goes as is, without cutting the last word
+            if len(section.content) <= 300:
+                return section.content
+            return self._section_preview(section)
+
+        return preview(sections[0]), preview(sections[-1]), classification
+
     def _build_frame_prompt(
         self,
         sections_summary: str,
@@ -667,14 +809,17 @@ class LongreadGenerator:
 
     def _build_sections_summary(self, sections: list[LongreadSection]) -> str:
         """Build summary of sections for intro/conclusion generation."""
-        lines = []
-        for section in sections:
-            lines.append(f"### {section.index}. {section.title}")
-            lines.append("")
-            preview = section.content[:300].rsplit(" ", 1)[0] + "..."
-            lines.append(preview)
-            lines.append("")
-        return "\n".join(lines)
+        return "\n".join(
+            f"### {section.index}. {section.title}\n\n{self._section_preview(section)}\n"
+            for section in sections
+        )
+
+    @staticmethod
+    def _section_preview(section: LongreadSection) -> str:
+        """Section content preview: first 300 chars cut at word boundary."""
+        head = section.content[:300]
+        cut, sep, _ = head.rpartition(" ")
+        return (cut if sep else head) + "..."
 
     # -------------------------------------------------------------------------
     # Shared: building Longread + validation
@@ -684,8 +829,6 @@ class LongreadGenerator:
         self,
         data: dict[str, Any],
         metadata: VideoMetadata,
-        tokens_input: int,
-        tokens_output: int,
         elapsed: float,
     ) -> Longread:
         """Build Longread object from parsed JSON data with validation."""
@@ -702,19 +845,25 @@ class LongreadGenerator:
             for idx, s in enumerate(sections_data)
         ]
 
-        # Validate classification
-        topic_area = self._validate_topic_area(data.get("topic_area", []))
+        # Validate classification (unclassified keeps topic_area empty)
+        if data.get("unclassified"):
+            topic_area = []
+        else:
+            topic_area = self._validate_topic_area(data.get("topic_area", []))
         access_level = self._validate_access_level(data.get("access_level"))
 
         # Calculate cost
         tokens_used = None
         cost = None
-        if tokens_input > 0 or tokens_output > 0:
-            tokens_used = TokensUsed(input=tokens_input, output=tokens_output)
+        tokens_input = self._prompt_tokens()
+        if tokens_input > 0 or self._total_output_tokens > 0:
+            tokens_used = TokensUsed(input=tokens_input, output=self._total_output_tokens)
             cost = calculate_cost(
                 self.settings.longread_model,
-                tokens_input,
-                tokens_output,
+                self._total_input_tokens,
+                self._total_output_tokens,
+                cache_write_tokens=self._total_cache_write_tokens,
+                cache_read_tokens=self._total_cache_read_tokens,
             )
 
         return Longread(
@@ -737,6 +886,21 @@ class LongreadGenerator:
             processing_time_sec=elapsed,
         )
 
+    def _count_usage(self, usage: ChatUsage) -> None:
+        """Add LLM call usage to totals (callers hold _tokens_lock if concurrent)."""
+        self._total_input_tokens += usage.input_tokens
+        self._total_output_tokens += usage.output_tokens
+        self._total_cache_write_tokens += usage.cache_write_tokens
+        self._total_cache_read_tokens += usage.cache_read_tokens
+
+    def _prompt_tokens(self) -> int:
+        """All prompt tokens including cached ones (for TokensUsed and PERF)."""
+        return (
+            self._total_input_tokens
+            + self._total_cache_write_tokens
+            + self._total_cache_read_tokens
+        )
+
     def _validate_topic_area(self, topic_area: Any) -> list[str]:
         """Validate and normalize topic_area from LLM response."""
         if isinstance(topic_area, str):
@@ -755,3 +919,149 @@ class LongreadGenerator:
     def _parse_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response."""
         return extract_and_parse_json(response, json_type="object", default={})
+
+
+if __name__ == "__main__":
+    """Run tests when executed directly."""
+    import hashlib
+    import sys
+    from datetime import date
+    from pathlib import Path
+
+    from app.config import get_settings
+
+    # Configure logging for tests
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s | %(name)s | %(message)s",
+    )
+
+    def run_tests() -> int:
+        """Run LongreadGenerator prompt tests (no LLM calls)."""
+        print("\n" + "=" * 60)
+        print("LongreadGenerator Tests")
+        print("=" * 60)
+
+        settings = get_settings()
+        generator = LongreadGenerator(ai_client=None, settings=settings)  # type: ignore[arg-type]
+
+        metadata = VideoMetadata(
+            date=date(2025, 1, 15),
+            event_type="ПШ",
+            stream="",
+            title="Тестовая тема",
+            speaker="Тест Спикер",
+            original_filename="test.mp4",
+            video_id="test-video",
+            source_path=Path("/tmp/test.mp4"),
+            archive_path=Path("/tmp/archive"),
+        )
+        parts = [
+            TextPart(index=i, text=f"Текст части {i}.", start_char=0, end_char=15)
+            for i in range(1, 7)
+        ]
+        part_groups = generator._group_parts(parts)
+        total_sections = len(part_groups)
+
+        # Test 1: Per-section fields go last, shared prefix is identical (prompt caching)
+        print("\nTest 1: Section prompts share an identical prefix...", end=" ")
+        try:
+            prefix_hashes = set()
+            for idx, group in enumerate(part_groups, 1):
+                prefix = generator._build_section_prefix(metadata, "Outline context")
+                suffix = generator._build_section_prompt(
+                    idx, total_sections, generator._format_parts(group)
+                )
+                assert f"раздел {idx} из {total_sections}" not in prefix
+                assert f"раздел {idx} из {total_sections}" in suffix
+                assert "Outline context" in prefix and "Outline context" not in suffix
+                prefix_hashes.add(hashlib.sha256(prefix.encode()).hexdigest())
+            assert len(prefix_hashes) == 1, f"Prefix differs: {len(prefix_hashes)} variants"
+            print("OK")
+            print(f"  Sections: {total_sections}, prefix hash: {prefix_hashes.pop()[:12]}")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
+        # Test 2: Cache tokens are counted in TokensUsed but priced at cache rates
+        print("\nTest 2: Cost prices cache tokens separately...", end=" ")
+        try:
+            generator._count_usage(ChatUsage(
+                input_tokens=1000, output_tokens=500,
+                cache_write_tokens=20_000, cache_read_tokens=60_000,
+            ))
+            longread = generator._build_longread({}, metadata, elapsed=1.0)
+            assert longread.tokens_used.input == 81_000, longread.tokens_used
+            expected = calculate_cost(
+                settings.longread_model, 1000, 500,
+                cache_write_tokens=20_000, cache_read_tokens=60_000,
+            )
+            assert longread.cost == expected, (longread.cost, expected)
+            plain = calculate_cost(settings.longread_model, 81_000, 500)
+            assert not plain or longread.cost < plain, "Cache billed as plain input"
+            print("OK")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
+        # Test 3: Batch path is bounded by max_parallel
+        print("\nTest 3: Batch inference passes max_parallel...", end=" ")
+        try:
+            class _BatchClient:
+                kwargs: dict = {}
+
+                async def generate_batch(self, prompts, **kwargs):
+                    self.kwargs = kwargs
+                    response = '{"title": "Раздел", "content": "Текст", "word_count": 1}'
+                    return [(response, ChatUsage()) for _ in prompts]
+
+            generator.ai_client = _BatchClient()  # type: ignore[assignment]
+            sections = asyncio.run(generator._generate_sections_batch(part_groups, "prefix"))
+            assert len(sections) == total_sections
+            assert generator.ai_client.kwargs["max_concurrency"] == generator.max_parallel
+            print("OK")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
+        # Test 4: Heuristic frame is gated by word count only, leaves no fake classification
+        print("\nTest 4: Heuristic frame gate and classification...", end=" ")
+        try:
+            generator.settings = settings.model_copy(
+                update={"longread_min_words_for_frame": 50}
+            )
+            long_section = LongreadSection(
+                index=1, title="Раздел", content="слово " * 60, word_count=60,
+            )
+            short_section = LongreadSection(
+                index=1, title="Раздел", content="Короткий текст.", word_count=2,
+            )
+            generator.ai_client = None  # type: ignore[assignment]
+            intro, _, classification = asyncio.run(
+                generator._generate_frame([short_section], metadata)
+            )
+            assert intro == "Короткий текст.", intro
+            assert classification == {"unclassified": True}, classification
+            try:
+                # One long section must go to the LLM (None client fails here)
+                asyncio.run(generator._generate_frame([long_section], metadata))
+                raise AssertionError("Single long section skipped the LLM")
+            except AttributeError:
+                pass
+            longread = generator._build_longread(
+                {"unclassified": True, "topic_area": ["мотивация"]},
+                metadata, elapsed=1.0,
+            )
+            assert longread.topic_area == [] and longread.tags == [], longread.topic_area
+            generator.settings = settings
+            print("OK")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return 0
+
+    sys.exit(run_tests())
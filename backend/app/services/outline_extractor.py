@@ -7,33 +7,107 @@ then combines into unified transcript outline with topic deduplication (REDUCE p
 Used to provide global context for chunking long transcripts.
 
 Configuration:
-    MAX_PARALLEL_LLM_REQUESTS: Maximum concurrent LLM requests (Semaphore)
+    Settings.outline_max_parallel: Maximum concurrent LLM requests (AdaptiveSemaphore)
     TOPIC_SIMILARITY_THRESHOLD: Jaccard similarity threshold for deduplication
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import re
+import sys
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from app.config import Settings, load_prompt
-from app.utils.json_utils import extract_and_parse_json, extract_json
+from app.utils.json_utils import JsonStreamScanner, extract_and_parse_json, extract_json
 from app.models.schemas import PartOutline, TextPart, TranscriptOutline
 from app.services.ai_clients import BaseAIClient, OllamaClient
+from app.utils.concurrency_utils import AdaptiveSemaphore, retry_on_rate_limit
 
 logger = logging.getLogger(__name__)
 perf_logger = logging.getLogger("app.perf")
 
 # Configuration
-MAX_PARALLEL_LLM_REQUESTS = 2  # Semaphore limit for stability
 TOPIC_SIMILARITY_THRESHOLD = 0.6  # Jaccard similarity for topic deduplication
 
+# Parsed part outlines by hash of (model, prompt), shared by all extractors
+# in the process (LRU, size: Settings.outline_cache_size)
+_outline_cache: OrderedDict[str, PartOutline] = OrderedDict()
+# In-flight extraction per (event loop, key): concurrent identical prompts
+# wait for one call. The entry lives while anyone holds or waits for the lock
+_outline_locks: dict[tuple[int, str], asyncio.Lock] = {}
+_outline_lock_users: dict[tuple[int, str], int] = {}
+
+# MAP prompt placeholders. Explicit names, not str.format_map: the prompt
+# contains a JSON example with literal curly braces
+_PLACEHOLDER_RE = re.compile(r"\{(part_index|total_parts|text|overlap_context)\}")
+
+_BATCH_PLACEHOLDER_RE = re.compile(r"\{(total_parts|parts)\}")
+
+# Overlap note by (has_overlap_before, has_overlap_after)
+OVERLAP_CONTEXT = {
+    (False, False): "",
+    (True, False): "Начало текста пересекается с предыдущей частью.",
+    (False, True): "Конец текста пересекается со следующей частью.",
+    (True, True): (
+        "Начало текста пересекается с предыдущей частью. "
+        "Конец текста пересекается со следующей частью."
+    ),
+}
+
+# Accepted topic for deduplication: (lowercased word set, its size, original text)
+TopicTokens = tuple[frozenset[str], int, str]
+
+@asynccontextmanager
+async def _single_flight(key: str) -> AsyncIterator[None]:
+    """Hold the lock of key, dropping it after the last holder or waiter leaves."""
+    # asyncio.Lock is bound to one event loop, so locks are not shared across loops
+    lock_key = (id(asyncio.get_running_loop()), key)
+    lock = _outline_locks.setdefault(lock_key, asyncio.Lock())
+    _outline_lock_users[lock_key] = _outline_lock_users.get(lock_key, 0) + 1
+    try:
+        async with lock:
+            yield
+    finally:
+        _outline_lock_users[lock_key] -= 1
+        if not _outline_lock_users[lock_key]:
+            del _outline_lock_users[lock_key]
+            del _outline_locks[lock_key]
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(topic: str) -> frozenset[str]:
+    """
+    Lowercased word set of a topic (cached: topics repeat across parts and runs).
+
+    Words are interned: common words ("клиент", "продажи") are one object
+    across all topics, and set comparisons hit the identity shortcut.
+    """
+    return frozenset(map(sys.intern, topic.lower().split()))
+
+
+@lru_cache(maxsize=4096)
+def _canonical(topic: str) -> str:
+    """
+    Word-order independent key of a topic: equal keys mean Jaccard 1.0.
+
+    "Продажи клиентам" and "клиентам продажи" share the key, so exact
+    duplicates are found with one dict lookup, without set arithmetic.
+    """
+    return " ".join(sorted(_tokenize(topic)))
+
 
 class OutlineExtractor:
     """
     Extract and combine outlines from transcript parts.
 
     Uses Map-Reduce pattern:
-    1. MAP: Extract outline from each part in parallel (with Semaphore limit)
+    1. MAP: Extract outline from each part in parallel (with adaptive limit)
     2. REDUCE: Combine outlines with topic deduplication
 
     Example:
@@ -48,7 +122,7 @@ class OutlineExtractor:
         self,
         ai_client: BaseAIClient,
         settings: Settings,
-        max_parallel: int = MAX_PARALLEL_LLM_REQUESTS,
+        max_parallel: int | None = None,
     ):
         """
         Initialize extractor.
@@ -57,18 +131,32 @@ class OutlineExtractor:
             ai_client: AI client for LLM calls
             settings: Application settings
             max_parallel: Maximum concurrent LLM requests
+                (default: settings.outline_max_parallel)
         """
         self.ai_client = ai_client
         self.settings = settings
-        self.max_parallel = max_parallel
+        self.max_parallel = max_parallel or settings.outline_max_parallel
+        # Shrinks on rate limits, regrows on success (shared by all parts)
+        self.limiter = AdaptiveSemaphore(self.max_parallel)
+        self.cache_size = settings.outline_cache_size
         # v0.31+: simplified signature
         self.prompt_template = load_prompt("outline", "map", settings)
+        # Split once: literal text and placeholder names alternate
+        self._template_segments = _PLACEHOLDER_RE.split(self.prompt_template)
+        # v0.86+: several parts per LLM call (1 = one call per part)
+        self.batch_size = max(1, settings.outline_batch_size)
+        self._batch_segments: list[str] = []
+        if self.batch_size > 1:
+            self._batch_segments = _BATCH_PLACEHOLDER_RE.split(
+                load_prompt("outline", "map_batch", settings)
+            )
 
     async def extract(self, parts: list[TextPart]) -> TranscriptOutline:
         """
         Extract combined outline from all parts.
 
-        Processes parts in parallel (with Semaphore limit), then reduces.
+        Processes parts in parallel (with adaptive limit), reducing each
+        part as soon as it and all previous parts are ready.
 
         Args:
             parts: List of text parts from TextSplitter
@@ -86,11 +174,8 @@ class OutlineExtractor:
 
         start_time = time.time()
 
-        # MAP phase: extract outlines with limited parallelism
-        part_outlines = await self._extract_parallel(parts)
-
-        # REDUCE phase: combine with deduplication
-        combined = self._reduce(part_outlines)
+        # MAP + REDUCE: parts are deduplicated as soon as they arrive
+        combined = await self._extract_parallel(parts)
 
         elapsed = time.time() - start_time
 
@@ -123,13 +208,46 @@ class OutlineExtractor:
         """
         prompt = self._build_prompt(part, total_parts)
 
+        if not self.cache_size:
+            outline = await self._request_outline(prompt, part)
+            return outline or self._create_fallback_outline(part)
+
+        # v0.86+: same prompt (re-run on the same transcript) is served from
+        # the process-wide LRU; concurrent identical prompts share one LLM call
+        model = getattr(self.ai_client, "default_model", None) or ""
+        key = hashlib.blake2b(
+            f"{model}\0{prompt}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        async with _single_flight(key):
+            cached = _outline_cache.get(key)
+            if cached is not None:
+                _outline_cache.move_to_end(key)
+                logger.debug("Part %d outline from cache", part.index)
+                return cached.model_copy()
+
+            outline = await self._request_outline(prompt, part)
+            if outline is None:
+                return self._create_fallback_outline(part)
+
+            _outline_cache[key] = outline
+            while len(_outline_cache) > self.cache_size:
+                _outline_cache.popitem(last=False)
+            return outline.model_copy()
+
+    async def _request_outline(self, prompt: str, part: TextPart) -> PartOutline | None:
+        """
+        Call LLM and parse part outline.
+
+        Returns:
+            PartOutline or None if LLM call failed
+        """
         try:
-            response, _usage = await self.ai_client.generate(prompt)
+            response = await self._generate_with_backoff(prompt)
             outline = self._parse_outline(response, part.index)
 
             logger.debug(
-                f"Part {part.index} outline: {len(outline.topics)} topics, "
-                f"{len(outline.key_points)} key points"
+                "Part %d outline: %d topics, %d key points",
+                part.index, len(outline.topics), len(outline.key_points),
             )
 
             return outline
@@ -139,40 +257,173 @@ class OutlineExtractor:
                 f"Failed to extract outline for part {part.index}: {e}. "
                 "Using fallback."
             )
-            return self._create_fallback_outline(part)
+            return None
 
-    async def _extract_parallel(self, parts: list[TextPart]) -> list[PartOutline]:
+    async def _extract_parallel(self, parts: list[TextPart]) -> TranscriptOutline:
         """
-        Extract outlines from all parts with limited parallelism.
+        Extract outlines from all parts with limited parallelism and reduce them.
+
+        Uses AdaptiveSemaphore to limit concurrent LLM requests: the limit
+        halves on rate limits and regrows on success.
+
+        A fixed pool of max_parallel workers pulls batches in order, so
+        memory doesn't grow with the number of parts. Each worker holds a
+        limiter slot only inside its own `async with`, so an aborted
+        TaskGroup cannot leak permits of the shared limiter.
 
-        Uses Semaphore to limit concurrent LLM requests for stability.
+        REDUCE runs while later parts are still in flight: finished outlines
+        are buffered and deduplicated in part order, so the result is the
+        same as reducing the full list after all parts complete.
 
         Args:
             parts: List of text parts
 
         Returns:
-            List of extracted outlines (in order)
+            Combined TranscriptOutline (parts in order)
         """
-        semaphore = asyncio.Semaphore(self.max_parallel)
         total_parts = len(parts)
 
-        async def limited_extract(part: TextPart) -> PartOutline:
-            async with semaphore:
-                logger.debug(f"Processing part {part.index}/{total_parts}")
-                return await self.extract_part_outline(part, total_parts)
+        outlines: list[PartOutline] = []
+        all_topics: list[str] = []
+        existing_tokens: list[TopicTokens] = []
+        postings: dict[str, list[int]] = {}
+        exact: dict[str, int] = {}
+        ready: dict[int, PartOutline] = {}
+
+        async def extract_batch(start: int, batch: list[TextPart]) -> None:
+            try:
+                async with self.limiter:
+                    logger.debug("Processing part %d/%d", batch[0].index, total_parts)
+                    if len(batch) == 1:
+                        batch_outlines = [await self.extract_part_outline(batch[0], total_parts)]
+                    else:
+                        batch_outlines = await self._extract_batch(batch, total_parts)
+            except Exception as e:
+                logger.error("Part %d outline extraction failed: %s", start + 1, e)
+                batch_outlines = [self._create_fallback_outline(part) for part in batch]
+
+            ready.update(enumerate(batch_outlines, start))
+            # Drain the contiguous prefix of finished parts in order
+            while len(outlines) in ready:
+                outline = ready.pop(len(outlines))
+                self._reduce_one(outline, all_topics, existing_tokens, postings, exact)
+                outlines.append(outline)
+
+        # Workers share one iterator: at most max_parallel part coroutines
+        # exist regardless of transcript length
+        starts = range(0, total_parts, self.batch_size)
+        pending = iter(starts)
+
+        async def worker() -> None:
+            for start in pending:
+                await extract_batch(start, parts[start:start + self.batch_size])
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(self.max_parallel, len(starts))):
+                tg.create_task(worker())
+
+        return self._combined(outlines, all_topics)
+
+    async def _extract_batch(
+        self, parts: list[TextPart], total_parts: int
+    ) -> list[PartOutline]:
+        """
+        Extract outlines of several parts with one LLM call (v0.86+).
 
-        tasks = [limited_extract(part) for part in parts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Falls back to per-part calls if the response is not a JSON array
+        with an outline for every part_index of the batch.
 
-        outlines: list[PartOutline] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Part {i + 1} outline extraction failed: {result}")
-                outlines.append(self._create_fallback_outline(parts[i]))
-            else:
-                outlines.append(result)
+        Args:
+            parts: Consecutive text parts of one batch
+            total_parts: Total number of parts (for context in prompt)
+
+        Returns:
+            PartOutline list in parts order
+        """
+        prompt = self._build_batch_prompt(parts, total_parts)
+
+        try:
+            response = await self._generate_with_backoff(prompt)
+            data = extract_and_parse_json(response, json_type="array", default=[])
+            by_index = {
+                item.get("part_index"): item
+                for item in data if isinstance(item, dict)
+            } if isinstance(data, list) else {}
+
+            if all(part.index in by_index for part in parts):
+                return [
+                    self._outline_from_data(by_index[part.index], part.index)
+                    for part in parts
+                ]
+            logger.warning(
+                "Batch outline for parts %d-%d is incomplete, "
+                "falling back to per-part calls",
+                parts[0].index, parts[-1].index,
+            )
+        except Exception as e:
+            logger.warning(
+                "Batch outline for parts %d-%d failed: %s. "
+                "Falling back to per-part calls",
+                parts[0].index, parts[-1].index, e,
+            )
+
+        return [await self.extract_part_outline(part, total_parts) for part in parts]
+
+    def _build_batch_prompt(self, parts: list[TextPart], total_parts: int) -> str:
+        """Build batch outline prompt with parts as JSON array."""
+        parts_json = json.dumps(
+            [
+                {
+                    "part_index": part.index,
+                    "overlap_context": OVERLAP_CONTEXT[part.has_overlap_before, part.has_overlap_after],
+                    "text": part.text,
+                }
+                for part in parts
+            ],
+            ensure_ascii=False,
+            indent=2,
+        )
+        values = {"total_parts": str(total_parts), "parts": parts_json}
+        return "".join(
+            values[segment] if i % 2 else segment
+            for i, segment in enumerate(self._batch_segments)
+        )
+
+    async def _generate_with_backoff(self, prompt: str) -> str:
+        """
+        Call LLM, retrying rate-limit errors with exponential backoff and jitter.
+
+        Each rate limit also halves the parallelism of self.limiter.
+        """
+        # Errors of the last attempt go to the caller (fallback outline)
+        return await retry_on_rate_limit(
+            lambda: self._generate_json(prompt), self.limiter
+        )
+
+    async def _generate_json(self, prompt: str) -> str:
+        """
+        Generate response, stopping the stream once the JSON value is closed.
+
+        Tokens the model would add after the JSON (comments, repeated
+        fences) are not waited for. Clients without generate_stream()
+        use plain generate().
+        """
+        generate_stream = getattr(self.ai_client, "generate_stream", None)
+        if generate_stream is None:
+            response, _usage = await self.ai_client.generate(prompt)
+            return response
 
-        return outlines
+        scanner = JsonStreamScanner()
+        chunks: list[str] = []
+        stream = generate_stream(prompt)
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                if scanner.feed(chunk):
+                    break
+        finally:
+            await stream.aclose()
+        return "".join(chunks)
 
     def _reduce(self, outlines: list[PartOutline]) -> TranscriptOutline:
         """
@@ -188,12 +439,66 @@ class OutlineExtractor:
         """
         # Collect all topics with deduplication
         all_topics: list[str] = []
+        # Word sets of accepted topics, computed once per topic (not per comparison)
+        existing_tokens: list[TopicTokens] = []
+        # Inverted index: word -> indices into existing_tokens
+        postings: dict[str, list[int]] = {}
+        # Canonical key -> index into existing_tokens (exact duplicates)
+        exact: dict[str, int] = {}
 
         for outline in outlines:
-            for topic in outline.topics:
-                if not self._is_duplicate_topic(topic, all_topics):
-                    all_topics.append(topic)
+            self._reduce_one(outline, all_topics, existing_tokens, postings, exact)
+
+        return self._combined(outlines, all_topics)
+
+    def _reduce_one(
+        self,
+        outline: PartOutline,
+        all_topics: list[str],
+        existing_tokens: list[TopicTokens],
+        postings: dict[str, list[int]],
+        exact: dict[str, int],
+    ) -> None:
+        """
+        Add non-duplicate topics of one part outline to running REDUCE state.
 
+        Topics with the same word set as an accepted one are caught by
+        a lookup in `exact` (most LLM topics are 1-3 words and repeat
+        verbatim). Otherwise only topics sharing at least one word with
+        the candidate (found via postings) are compared: Jaccard with any
+        other topic is 0.
+
+        Sequential on purpose: a topic is compared only with accepted ones,
+        so an all-pairs similarity matrix would also drop topics similar to
+        already rejected duplicates.
+        """
+        for topic in outline.topics:
+            topic_words = _tokenize(topic)
+            canonical = _canonical(topic)
+            if canonical and canonical in exact:
+                logger.debug(
+                    "Duplicate topic: '%s' == '%s'",
+                    topic, existing_tokens[exact[canonical]][2],
+                )
+                continue
+            candidates = sorted({
+                idx for word in topic_words for idx in postings.get(word, ())
+            })
+            if not self._is_duplicate_words(
+                topic, topic_words, [existing_tokens[idx] for idx in candidates]
+            ):
+                all_topics.append(topic)
+                for word in topic_words:
+                    postings.setdefault(word, []).append(len(existing_tokens))
+                exact.setdefault(canonical, len(existing_tokens))
+                existing_tokens.append((topic_words, len(topic_words), topic))
+
+    def _combined(
+        self,
+        outlines: list[PartOutline],
+        all_topics: list[str],
+    ) -> TranscriptOutline:
+        """Build TranscriptOutline from reduced part outlines."""
         total_input_topics = sum(len(o.topics) for o in outlines)
         logger.debug(
             f"Reduced {total_input_topics} topics to {len(all_topics)} unique"
@@ -215,21 +520,57 @@ class OutlineExtractor:
         Returns:
             True if topic is a duplicate (similarity >= threshold)
         """
-        topic_words = set(topic.lower().split())
-
+        existing_tokens: list[TopicTokens] = []
         for existing in existing_topics:
-            existing_words = set(existing.lower().split())
+            words = _tokenize(existing)
+            existing_tokens.append((words, len(words), existing))
+        return self._is_duplicate_words(
+            topic, _tokenize(topic), existing_tokens
+        )
+
+    def _is_duplicate_words(
+        self,
+        topic: str,
+        topic_words: frozenset[str],
+        existing_tokens: list[TopicTokens],
+    ) -> bool:
+        """
+        Jaccard duplicate check against precomputed word sets.
+
+        Args:
+            topic: New topic (for logging)
+            topic_words: Lowercased word set of the new topic
+            existing_tokens: (words, len(words), topic) of accepted topics
 
-            # Skip empty sets
-            if not topic_words or not existing_words:
+        Returns:
+            True if topic is a duplicate (similarity >= threshold)
+        """
+        # Skip empty sets
+        if not topic_words:
+            return False
+
+        topic_len = len(topic_words)
+        # Locals in the hot loop: LOAD_FAST instead of global lookups
+        threshold = TOPIC_SIMILARITY_THRESHOLD
+        min_len = threshold * topic_len
+        max_len = topic_len / threshold
+
+        for existing_words, existing_len, existing in existing_tokens:
+            # Jaccard <= min(|A|, |B|) / max(|A|, |B|): pairs of too different
+            # size can't reach the threshold, skip set intersection for them
+            if existing_len < min_len or existing_len > max_len:
                 continue
 
-            # Calculate Jaccard similarity: |intersection| / |union|
+            # Calculate Jaccard similarity: |A & B| / |A | B|,
+            # union size from |A| + |B| - |A & B| without building the union set.
+            # frozenset & runs in C; a Python two-pointer walk over sorted
+            # tuples is ~5x slower for 3-6 word topics, so sets stay
             intersection = len(topic_words & existing_words)
-            union = len(topic_words | existing_words)
-            similarity = intersection / union
+            if not intersection:
+                continue
+            similarity = intersection / (topic_len + existing_len - intersection)
 
-            if similarity >= TOPIC_SIMILARITY_THRESHOLD:
+            if similarity >= threshold:
                 logger.debug(
                     f"Duplicate topic: '{topic}' ~ '{existing}' "
                     f"(similarity: {similarity:.2f})"
@@ -249,23 +590,17 @@ class OutlineExtractor:
         Returns:
             Complete prompt for LLM
         """
-        prompt = self.prompt_template
-
-        # Replace placeholders
-        prompt = prompt.replace("{part_index}", str(part.index))
-        prompt = prompt.replace("{total_parts}", str(total_parts))
-        prompt = prompt.replace("{text}", part.text)
-
-        # Build overlap context
-        overlap_context = ""
-        if part.has_overlap_before:
-            overlap_context += "Начало текста пересекается с предыдущей частью. "
-        if part.has_overlap_after:
-            overlap_context += "Конец текста пересекается со следующей частью."
-
-        prompt = prompt.replace("{overlap_context}", overlap_context.strip())
-
-        return prompt
+        values = {
+            "part_index": str(part.index),
+            "total_parts": str(total_parts),
+            "text": part.text,
+            "overlap_context": OVERLAP_CONTEXT[part.has_overlap_before, part.has_overlap_after],
+        }
+        # Odd segments of the pre-split template are placeholder names
+        return "".join(
+            values[segment] if i % 2 else segment
+            for i, segment in enumerate(self._template_segments)
+        )
 
     def _parse_outline(self, response: str, part_index: int) -> PartOutline:
         """
@@ -286,6 +621,10 @@ class OutlineExtractor:
         if data is None:
             raise ValueError("Failed to extract or parse JSON from outline response")
 
+        return self._outline_from_data(data, part_index)
+
+    def _outline_from_data(self, data: dict, part_index: int) -> PartOutline:
+        """Build PartOutline from parsed JSON object with range limits."""
         # Extract and validate fields
         topics = data.get("topics", [])
         key_points = data.get("key_points", [])
@@ -319,9 +658,10 @@ class OutlineExtractor:
         Returns:
             Basic PartOutline
         """
-        # Extract first sentence as summary
-        sentences = part.text.split(". ")
-        summary = sentences[0][:300] if sentences else part.text[:300]
+        # Extract first sentence as summary (search only within the first
+        # 300 chars instead of splitting the whole part into sentences)
+        sentence_end = part.text.find(". ", 0, 301)
+        summary = part.text[:sentence_end] if sentence_end != -1 else part.text[:300]
 
         # Add period if missing
         if summary and not summary.endswith("."):
@@ -341,7 +681,6 @@ class OutlineExtractor:
 
 if __name__ == "__main__":
     """Run tests when executed directly."""
-    import sys
 
     from app.config import get_settings
     from app.services.text_splitter import TextSplitter
@@ -461,7 +800,8 @@ if __name__ == "__main__":
                 ),
                 PartOutline(
                     part_index=2,
-                    topics=["Продукт Формула 1", "Маркетинг"],  # "Продукт Формула 1" similar
+                    # "Продукт Формула 1" similar, "клиентами Работа с" exact (reordered)
+                    topics=["Продукт Формула 1", "Маркетинг", "клиентами Работа с"],
                     key_points=["Тезис 2"],
                     summary="Содержание второй части транскрипта",
                 ),
@@ -481,8 +821,72 @@ if __name__ == "__main__":
             print(f"FAILED: {e}")
             return 1
 
-        # Test 6: Full extraction with LLM (if available)
-        print("\nTest 6: Full extraction with LLM...", end=" ")
+        # Test 6: Parallel MAP keeps part order and never leaks limiter slots
+        print("\nTest 6: Parallel extraction order and slots...", end=" ")
+        try:
+            extractor = OutlineExtractor(None, settings, max_parallel=3)  # type: ignore
+            extractor.batch_size = 1
+
+            class _Abort(BaseException):
+                """Not caught per part: aborts the TaskGroup."""
+
+            async def fake_part_outline(part: TextPart, total_parts: int) -> PartOutline:
+                await asyncio.sleep(0.001 * (total_parts - part.index))
+                if part.index == fail_index:
+                    raise _Abort
+                return extractor._create_fallback_outline(part)
+
+            extractor.extract_part_outline = fake_part_outline  # type: ignore[method-assign]
+            test_parts = [
+                TextPart(index=i, text=f"Текст {i}", start_char=0, end_char=7)
+                for i in range(1, 9)
+            ]
+
+            fail_index = 0
+            combined = await extractor._extract_parallel(test_parts)
+            assert [p.part_index for p in combined.parts] == list(range(1, 9))
+
+            fail_index = 2
+            try:
+                await extractor._extract_parallel(test_parts)
+                raise AssertionError("TaskGroup was not aborted")
+            except* _Abort:
+                pass
+            assert extractor.limiter._active == 0, extractor.limiter._active
+
+            print("OK")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
+        # Test 7: Single-flight: one LLM call for identical prompts, no lock leftovers
+        print("\nTest 7: Single-flight outline cache...", end=" ")
+        try:
+            extractor = OutlineExtractor(None, settings)  # type: ignore
+            extractor.cache_size = extractor.cache_size or 8
+            llm_calls = 0
+
+            async def fake_request(prompt: str, part: TextPart) -> PartOutline:
+                nonlocal llm_calls
+                llm_calls += 1
+                await asyncio.sleep(0.01)
+                return extractor._create_fallback_outline(part)
+
+            extractor._request_outline = fake_request  # type: ignore[method-assign]
+            part = TextPart(index=1, text="Одинаковый текст", start_char=0, end_char=16)
+            _outline_cache.clear()
+            await asyncio.gather(*(extractor.extract_part_outline(part, 1) for _ in range(5)))
+            assert llm_calls == 1, llm_calls
+            assert not _outline_locks and not _outline_lock_users, _outline_lock_users
+            _outline_cache.clear()
+
+            print("OK")
+        except Exception as e:
+            print(f"FAILED: {e}")
+            return 1
+
+        # Test 8: Full extraction with LLM (if available)
+        print("\nTest 8: Full extraction with LLM...", end=" ")
 
         async with OllamaClient.from_settings(settings) as client:
             status = await client.check_services()
@@ -18,7 +18,10 @@ Event type determines regular/offsite via events.yaml lookup.
 
 import logging
 import re
-from datetime import date, datetime
+import sys
+import unicodedata
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 from app.config import get_settings, load_events_config
@@ -28,31 +31,62 @@ logger = logging.getLogger(__name__)
 
 
 class FilenameParseError(Exception):
-    """Raised when filename doesn't match expected pattern."""
+    """
+    Raised when filename doesn't match expected pattern.
+
+    The default message is formatted only in __str__: scans that skip
+    non-matching files never pay for it.
+    """
 
     def __init__(self, filename: str, message: str | None = None):
         self.filename = filename
-        if message is None:
-            message = (
-                f"Filename '{filename}' doesn't match expected pattern. "
-                f"Expected format: '{{YYYY.MM[.DD]}} {{type}}[.{{stream}}]. {{title}} ({{speaker}}).ext'"
-            )
-        super().__init__(message)
+        self.message = message
+        super().__init__(filename if message is None else message)
+
+    def __str__(self) -> str:
+        if self.message is not None:
+            return self.message
+        return (
+            f"Filename '{self.filename}' doesn't match expected pattern.\n"
+            f"Expected format: '{{YYYY.MM[.DD]}} {{type}}[.{{stream}}]. {{title}} ({{speaker}}).ext'"
+        )
 
 
 # Unified filename pattern (v0.69+)
 # Format: {date} {type}[.{stream}]. {title} ({speaker}).ext
-# Groups: (1) date, (2) event group (type[.stream]), (3) title, (4) speaker
+# Used with fullmatch (no ^/$ anchors).
+# Groups: date, type, stream (None if absent: use groups(default="")),
+# title, speaker. Stream is the part after
+# the last dot of the event group and doesn't start with whitespace:
+# "ПШ. X. Тема" is event ПШ with title "X. Тема"
+# Possessive quantifiers (Python 3.11+) where giving back characters can't
+# produce a match: the engine doesn't retry them when the tail fails.
+# Stdlib re has them since 3.11, so the third-party `regex` isn't needed.
+# Title stays lazy ".+?": it may contain parentheses ("Тема (часть 2)"),
+# so it can't be narrowed to [^()].
 EVENT_PATTERN = re.compile(
-    r'^(\d{4}\.\d{2}(?:\.\d{2})?)\s+'   # Date: 2025.04.07 or 2025.04
-    r'(.+?)\.\s+'                    # Event group: ПШ.SV or Форум TABTeam
-    r'(.+?)\s+'                      # Title: Группа поддержки or История
-    r'\(([^)]+)\)'                   # Speaker/Names: (Светлана Дмитрук)
-    r'(?:\.\w+)?$',                  # Extension: .mp4
+    r'(?P<date>\d{4}\.\d{2}(?:\.\d{2})?)\s++'             # Date: 2025.04.07 or 2025.04
+    r'(?P<type>.+?)(?:\.(?P<stream>[^.\s][^.]*)?)?\.\s+'  # Event: ПШ.SV or Форум TABTeam
+    r'(?P<title>.+?)\s+'                                  # Title: Группа поддержки or История
+    r'\((?P<speaker>[^)]++)\)'                            # Speaker/Names: (Светлана Дмитрук)
+    r'(?:\.\w++)?',                                       # Extension: .mp4
     re.UNICODE
 )
 
+# Zero-padded month/day strings for archive folders: tuple index instead of
+# "{:02d}" formatting per path component
+_TWO_DIGITS = tuple(f"{n:02d}" for n in range(32))
+
+# slugify: characters to drop (keep letters, digits, "_", dashes and spaces),
+# runs of spaces/dashes to collapse into one dash.
+# str.translate with a lazily filled table (isalnum() or "-_", same set as
+# \w) was measured ~2x slower than this regex on Cyrillic titles: for
+# non-ASCII text translate looks up every code point as a Python int key
+_SLUG_STRIP_RE = re.compile(r'[^\w\- ]', re.UNICODE)
+_SLUG_DASHES_RE = re.compile(r'[ \-]+')
+
 
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """
     Convert text to slug format.
@@ -61,6 +95,16 @@ def slugify(text: str) -> str:
     - Remove special characters (keep letters, digits, dashes)
     - Convert to lowercase
     - Cyrillic characters are preserved
+    - NFC-normalized first: filenames from macOS come in NFD
+      ("й" as "и" + combining breve), which would otherwise lose the mark
+      and give a different slug than the same title typed on Windows/Linux.
+      Not NFKC: folding compatibility forms ("№" -> "No", full-width
+      digits) would change video_id of already processed titles
+
+    Called once per uncached filename (via generate_video_id), so it is
+    kept in pure Python: a C extension would add a build step for
+    microseconds per video. Cached: the same title recurs across dates
+    (series, repeated topics).
 
     Args:
         text: Input text to slugify
@@ -68,17 +112,18 @@ def slugify(text: str) -> str:
     Returns:
         Slugified text
     """
-    # Convert to lowercase
-    text = text.lower()
+    # Compose combining marks (NFD → NFC)
+    text = unicodedata.normalize('NFC', text)
 
-    # Replace spaces with dashes
-    text = text.replace(' ', '-')
+    # Convert to lowercase (str.lower is a tight C loop; a maketrans table
+    # for ASCII + Cyrillic measured ~13x slower and misses other alphabets)
+    text = text.lower()
 
-    # Keep only letters (including cyrillic), digits, and dashes
-    text = re.sub(r'[^\w\-]', '', text, flags=re.UNICODE)
+    # Keep only letters (including cyrillic), digits, dashes and spaces
+    text = _SLUG_STRIP_RE.sub('', text)
 
-    # Replace multiple dashes with single dash
-    text = re.sub(r'-+', '-', text)
+    # Replace spaces and runs of dashes with single dash
+    text = _SLUG_DASHES_RE.sub('-', text)
 
     # Strip leading/trailing dashes
     text = text.strip('-')
@@ -111,6 +156,55 @@ def generate_video_id(d: date, event_type: str, stream: str, title: str) -> str:
     return f"{date_str}_{type_stream}_{title_slug}"
 
 
+def _events_config() -> dict:
+    """
+    Events configuration, parsed once per version of events.yaml.
+
+    Keyed by file mtime: edits to events.yaml are picked up without restart,
+    while a batch of filenames costs one stat() each instead of a YAML parse.
+    The returned dict is shared between calls and must not be modified.
+    """
+    return _load_events_config(*_events_version())
+
+
+def _events_version() -> tuple[Path, int]:
+    """Cache key of events.yaml: path and mtime."""
+    events_path = get_settings().config_dir / "events.yaml"
+    return events_path, events_path.stat().st_mtime_ns
+
+
+@lru_cache(maxsize=1)
+def _load_events_config(events_path: Path, mtime_ns: int) -> dict:
+    """Parse events.yaml (cache key: path and mtime)."""
+    return load_events_config()
+
+
+@lru_cache(maxsize=1)
+def _load_event_streams(
+    events_path: Path,
+    mtime_ns: int,
+) -> dict[str, frozenset[str]]:
+    """Known streams per event type (cache key: path and mtime)."""
+    event_types = _load_events_config(events_path, mtime_ns).get('event_types', {})
+    return {
+        event_type: frozenset(info.get('streams') or ())
+        for event_type, info in event_types.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _load_event_categories(
+    events_path: Path,
+    mtime_ns: int,
+) -> dict[str, EventCategory]:
+    """Category per event type (cache key: path and mtime)."""
+    event_types = _load_events_config(events_path, mtime_ns).get('event_types', {})
+    return {
+        event_type: EventCategory(info.get('category', 'regular'))
+        for event_type, info in event_types.items()
+    }
+
+
 def validate_event_type_stream(event_type: str, stream: str) -> None:
     """
     Validate event_type and stream against events.yaml configuration.
@@ -122,26 +216,26 @@ def validate_event_type_stream(event_type: str, stream: str) -> None:
         stream: Stream code to validate (can be empty)
     """
     try:
-        events_config = load_events_config()
-        event_types = events_config.get('event_types', {})
-
-        if event_type not in event_types:
-            logger.warning(
-                f"Unknown event type '{event_type}'. "
-                f"Known types: {list(event_types.keys())}"
-            )
+        # Two set/dict lookups in the happy path, no per-call dicts or lists
+        event_streams = _load_event_streams(*_events_version())
+        known_streams = event_streams.get(event_type)
+
+        # Known-values lists are built only if the warning will be emitted
+        if known_streams is None:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"Unknown event type '{event_type}'. "
+                    f"Known types: {list(event_streams)}"
+                )
             return
 
         # Skip stream validation if stream is empty
-        if not stream:
-            return
-
-        event_streams = event_types[event_type].get('streams', {})
-        if stream not in event_streams:
-            logger.warning(
-                f"Unknown stream '{stream}' for event type '{event_type}'. "
-                f"Known streams: {list(event_streams.keys())}"
-            )
+        if stream and stream not in known_streams:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"Unknown stream '{stream}' for event type '{event_type}'. "
+                    f"Known streams: {sorted(known_streams)}"
+                )
     except Exception as e:
         logger.warning(f"Could not validate event type/stream: {e}")
 
@@ -157,11 +251,9 @@ def get_event_category(event_type: str) -> EventCategory:
         EventCategory.REGULAR or EventCategory.OFFSITE based on events.yaml
     """
     try:
-        events_config = load_events_config()
-        event_types = events_config.get('event_types', {})
-        event_info = event_types.get(event_type, {})
-        category = event_info.get('category', 'regular')
-        return EventCategory(category)
+        # Unknown types in a valid config are regular (as with no 'category')
+        categories = _load_event_categories(*_events_version())
+        return categories.get(event_type, EventCategory.REGULAR)
     except Exception:
         return EventCategory.REGULAR if event_type == "ПШ" else EventCategory.OFFSITE
 
@@ -181,7 +273,7 @@ def resolve_event_name(event_type: str, stream: str) -> str:
         Display name for the event
     """
     try:
-        events_config = load_events_config()
+        events_config = _events_config()
         event_info = events_config.get("event_types", {}).get(event_type, {})
         display_name = event_info.get("display_name", event_type)
     except Exception:
@@ -218,45 +310,78 @@ def parse_filename(
     if source_path is None:
         source_path = settings.inbox_dir / filename
 
-    # Try unified event pattern
-    match = EVENT_PATTERN.match(filename)
-    if match:
-        return _parse_event(match, filename, source_path, settings)
+    return _parse_event(filename, source_path, settings)
 
-    # No pattern matched
-    raise FilenameParseError(
-        filename,
-        f"Filename '{filename}' doesn't match expected pattern.\n"
-        f"Expected format: '{{YYYY.MM[.DD]}} {{type}}[.{{stream}}]. {{title}} ({{speaker}}).ext'"
-    )
 
+# Parsed filename fields: (date, event_type, stream, title, speaker,
+# content_type, video_id)
+ParsedFields = tuple[date, str, str, str, str, ContentType, str]
 
-def _parse_event(
-    match: re.Match,
-    filename: str,
-    source_path: Path,
-    settings,
-) -> VideoMetadata:
-    """Parse unified event filename (v0.69+)."""
-    date_str, event_group, title, speaker = match.groups()
 
-    # Parse date
+@lru_cache(maxsize=4096)
+def _parse_fields(filename: str) -> ParsedFields:
+    """
+    Parse filename fields that depend only on the filename.
+
+    Cached: rescans and retries parse the same names again. Parse errors
+    are not cached (lru_cache doesn't store exceptions). There is no
+    vectorized batch path: ParseStage parses one file per pipeline run.
+
+    Raises:
+        FilenameParseError: If filename doesn't match expected pattern
+    """
+    # Try unified event pattern. Cheap gate first: temp/hidden files and
+    # other names without "YYYY.MM" prefix are rejected without the regex
+    if (
+        filename[4:5] == '.'
+        and filename[7:8] in (' ', '.')
+        and filename[:4].isdigit()
+    ):
+        match = EVENT_PATTERN.fullmatch(filename)
+    else:
+        match = None
+    if not match:
+        # No pattern matched
+        raise FilenameParseError(filename)
+
+    # groups() in pattern order: groupdict() would build a dict per parse
+    date_str, event_type, stream, title, speaker = match.groups(default="")
+    # A few dozen distinct values across all files: share one object each
+    event_type = sys.intern(event_type)
+    stream = sys.intern(stream)
+
+    # Parse date (regex guarantees digits; fromisoformat is a C fast path,
+    # strptime runs the generic format parser on every call)
     try:
         if len(date_str) == 10:  # YYYY.MM.DD
-            video_date = datetime.strptime(date_str, '%Y.%m.%d').date()
+            video_date = date.fromisoformat(date_str.replace('.', '-'))
         else:  # YYYY.MM (day defaults to 1)
-            video_date = datetime.strptime(date_str, '%Y.%m').date()
+            video_date = date.fromisoformat(f"{date_str.replace('.', '-')}-01")
     except ValueError as e:
         raise FilenameParseError(filename, f"Invalid date format: {e}")
 
-    # Parse event group: "ПШ.SV" → ("ПШ", "SV"), "Форум TABTeam" → ("Форум TABTeam", "")
-    if '.' in event_group:
-        last_dot = event_group.rindex('.')
-        event_type = event_group[:last_dot]
-        stream = event_group[last_dot + 1:]
+    # Leadership detection: "#История" marker → LEADERSHIP
+    if title.startswith("#История"):
+        content_type = ContentType.LEADERSHIP
+        title = title[1:]  # Strip '#' — marker consumed by parser
     else:
-        event_type = event_group
-        stream = ""
+        content_type = ContentType.EDUCATIONAL
+
+    # Generate video ID
+    video_id = generate_video_id(video_date, event_type, stream, title)
+
+    return video_date, event_type, stream, title, speaker, content_type, video_id
+
+
+def _parse_event(
+    filename: str,
+    source_path: Path,
+    settings,
+) -> VideoMetadata:
+    """Parse unified event filename (v0.69+)."""
+    (
+        video_date, event_type, stream, title, speaker, content_type, video_id
+    ) = _parse_fields(filename)
 
     # Validate event type and stream
     validate_event_type_stream(event_type, stream)
@@ -264,36 +389,25 @@ def _parse_event(
     # Determine event category
     event_category = get_event_category(event_type)
 
-    # Leadership detection: "#История" marker → LEADERSHIP
-    if title.startswith("#История"):
-        content_type = ContentType.LEADERSHIP
-        title = title[1:]  # Strip '#' — marker consumed by parser
-    else:
-        content_type = ContentType.EDUCATIONAL
-
     # Resolve event_name
     event_name = resolve_event_name(event_type, stream)
 
-    # Generate video ID
-    video_id = generate_video_id(video_date, event_type, stream, title)
-
     # Generate archive path based on event category (3-level structure)
     if event_category == EventCategory.REGULAR:
         event_group = event_type
-        date_prefix = f"{video_date.month:02d}.{video_date.day:02d}"
+        date_prefix = f"{_TWO_DIGITS[video_date.month]}.{_TWO_DIGITS[video_date.day]}"
         if stream:
             topic_folder = f"{date_prefix} {stream}. {title} ({speaker})"
         else:
             topic_folder = f"{date_prefix} {title} ({speaker})"
     else:
-        event_group = f"{video_date.month:02d} {event_type}"
+        event_group = f"{_TWO_DIGITS[video_date.month]} {event_type}"
         topic_folder = f"{title} ({speaker})"
 
-    archive_path = (
-        settings.archive_dir
-        / str(video_date.year)
-        / event_group
-        / topic_folder
+    # One Path from a joined string: each "/" would build and normalize
+    # an intermediate Path
+    archive_path = Path(
+        f"{settings.archive_dir}/{video_date.year}/{event_group}/{topic_folder}"
     )
 
     return VideoMetadata(
@@ -466,6 +580,7 @@ if __name__ == "__main__":
             assert False, "Should have raised FilenameParseError"
         except FilenameParseError as e:
             assert "invalid_filename.mp4" in str(e)
+            assert "Expected format" in str(e)
 
         print("OK")
 
@@ -629,6 +744,60 @@ if __name__ == "__main__":
 
         print("OK")
 
+    def test_events_config_cached():
+        """Test 23: events.yaml is parsed once for repeated parses."""
+        print("Test 23: Events config cached...", end=" ")
+
+        first = _events_config()
+        misses = _load_events_config.cache_info().misses
+        parse_filename("2025.04.07 ПШ.SV. Группа поддержки (Светлана Дмитрук).mp4")
+        parse_filename("2026.02 ФСТ. Спонсор, за которым идут (Дмитрук Светлана).mp4")
+        assert _events_config() is first, "events.yaml parsed again"
+        assert _load_events_config.cache_info().misses == misses, "events.yaml parsed again"
+        assert "ПШ" in first.get("event_types", {})
+
+        print("OK")
+
+    def test_parse_cached_source_path():
+        """Test 24: Cached parse keeps per-call source_path."""
+        print("Test 24: Cached parse with source_path...", end=" ")
+
+        filename = "2025.04.07 ПШ.SV. Группа поддержки (Светлана Дмитрук).mp4"
+        first = parse_filename(filename, Path("/a") / filename)
+        hits = _parse_fields.cache_info().hits
+        second = parse_filename(filename, Path("/b") / filename)
+        assert _parse_fields.cache_info().hits == hits + 1, "No cache hit"
+        assert first.video_id == second.video_id
+        assert str(second.source_path).startswith("/b/"), second.source_path
+
+        print("OK")
+
+    def test_slugify_nfd():
+        """Test 25: NFD/look-alike variants give the same slug, compat forms are kept."""
+        print("Test 25: Slugify Unicode variants...", end=" ")
+
+        title = "Свой бизнес и ёмкость рынка"
+        nfd = unicodedata.normalize("NFD", title)
+        assert nfd != title
+        assert slugify(nfd) == slugify(title) == "свой-бизнес-и-ёмкость-рынка", slugify(nfd)
+        # Compatibility forms keep their pre-NFC slugs (video_id stays the same)
+        assert slugify("Урок №2") == "урок-2", slugify("Урок №2")
+        assert slugify("Итоги ２０２５") == "итоги-２０２５"
+        # Apostrophe look-alikes are dropped
+        assert slugify("Let’s go") == slugify("Let`s go") == slugify("Let's go") == "lets-go"
+
+        print("OK")
+
+    def test_parentheses_in_title():
+        """Test 26: Parentheses inside title, speaker is the last group."""
+        print("Test 26: Parentheses in title...", end=" ")
+
+        metadata = parse_filename("2025.04.07 ПШ. Тема (часть 2) (Спикер).mp4")
+        assert metadata.title == "Тема (часть 2)", metadata.title
+        assert metadata.speaker == "Спикер", metadata.speaker
+
+        print("OK")
+
     # Run all tests
     print("\nRunning parser tests...\n")
 
@@ -655,6 +824,10 @@ if __name__ == "__main__":
         test_leadership_hash_marker,
         test_educational_with_история_in_title,
         test_archive_path_regular_with_stream_separator,
+        test_events_config_cached,
+        test_parse_cached_source_path,
+        test_slugify_nfd,
+        test_parentheses_in_title,
     ]
 
     failed = 0
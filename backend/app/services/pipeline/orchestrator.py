@@ -7,12 +7,15 @@ Supports both full pipeline execution and step-by-step mode for testing.
 v0.84+: Uses BaseStage.execute() instead of direct service calls (ADR-001 Phase 1).
 """
 
+import asyncio
 import logging
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 from app.config import Settings, get_settings
 from app.services.progress_estimator import ProgressEstimator
+from app.services.saver import FileSaver
 from app.models.schemas import (
     CleanedTranscript,
     Longread,
@@ -90,6 +93,11 @@ class PipelineOrchestrator:
         metadata = await orchestrator.parse(Path("inbox/video.mp4"))
         raw = await orchestrator.transcribe(Path("inbox/video.mp4"))
         cleaned = await orchestrator.clean(raw, metadata)
+
+    Example (one AI client per provider across all calls):
+        async with PipelineOrchestrator() as orchestrator:
+            cleaned = await orchestrator.clean(raw, metadata)
+            longread = await orchestrator.longread(cleaned, metadata)
     """
 
     def __init__(self, settings: Settings | None = None):
@@ -105,6 +113,15 @@ class PipelineOrchestrator:
         self.config_resolver = ConfigResolver(self.settings)
         self.processing_strategy = ProcessingStrategy(self.settings)
 
+    async def __aenter__(self) -> "PipelineOrchestrator":
+        """Share AI clients between stages until exit."""
+        self.processing_strategy.share_clients()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close shared AI clients."""
+        await self.processing_strategy.close_shared_clients()
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Full Pipeline
     # ═══════════════════════════════════════════════════════════════════════════
@@ -139,36 +156,85 @@ class PipelineOrchestrator:
         stages = self._build_pipeline()
         context = StageContext(metadata={"video_path": str(video_path)})
 
-        for stage in stages:
-            if stage.should_skip(context):
-                logger.info(f"Skipping stage: {stage.name}")
-                continue
-
-            # v0.85+: For foreign transcripts, feed longread into summarize
-            if stage.name == "summarize" and context.has_result("longread"):
-                metadata = context.get_result("parse")
-                if metadata.language == "foreign":
-                    longread = context.get_result("longread")
-                    longread_text = longread.to_markdown()
-                    clean = context.get_result("clean")
-                    logger.info(
-                        f"foreign_summary_from_longread: longread_chars={len(longread_text)}, transcript_chars={len(clean.text)}"
+        raw_save: asyncio.Task[list[str]] | None = None
+        try:
+            for stage in stages:
+                if stage.should_skip(context):
+                    logger.info(f"Skipping stage: {stage.name}")
+                    continue
+
+                # v0.85+: For foreign transcripts, feed longread into summarize
+                if stage.name == "summarize" and context.has_result("longread"):
+                    metadata = context.get_result("parse")
+                    if metadata.language == "foreign":
+                        longread = context.get_result("longread")
+                        longread_text = longread.to_markdown()
+                        clean = context.get_result("clean")
+                        logger.info(
+                            f"foreign_summary_from_longread: longread_chars={len(longread_text)}, transcript_chars={len(clean.text)}"
+                        )
+                        context = context.with_result("clean", CleanedTranscript(
+                            text=longread_text,
+                            original_length=clean.original_length,
+                            cleaned_length=len(longread_text),
+                            model_name=clean.model_name,
+                        ))
+                        context = context.with_metadata("language_override", "ru")
+
+                if stage.name == "save" and raw_save:
+                    context = context.with_metadata(
+                        "raw_files", await self._await_raw_save(raw_save, context)
                     )
-                    context = context.with_result("clean", CleanedTranscript(
-                        text=longread_text,
-                        original_length=clean.original_length,
-                        cleaned_length=len(longread_text),
-                        model_name=clean.model_name,
-                    ))
-                    context = context.with_metadata("language_override", "ru")
 
-            result = await self._execute_with_progress(stage, context, progress_callback)
-            context = context.with_result(stage.name, result)
+                result = await self._execute_with_progress(stage, context, progress_callback)
+                context = context.with_result(stage.name, result)
+
+                # Transcripts and audio are final now: stage them while LLM stages run
+                if stage.name == "clean":
+                    raw_save = self._start_raw_save(context)
+        except BaseException:
+            if raw_save:
+                # A stage after clean failed: staged files must not linger
+                await self._discard_raw_save(raw_save, context)
+            raise
 
         processing_time = (datetime.now() - started_at).total_seconds()
 
         return self._build_processing_result(context, processing_time)
 
+    def _start_raw_save(self, context: StageContext) -> asyncio.Task[list[str]] | None:
+        """Start saving transcripts and audio in background right after clean."""
+        metadata: VideoMetadata = context.get_result("parse")
+        if metadata.language == "foreign":
+            # Cleaned result is replaced by longread before summarize;
+            # SaveStage writes transcripts itself to keep that behavior
+            return None
+
+        raw_transcript, audio_path = context.get_result("transcribe")
+        return asyncio.create_task(FileSaver(self.settings).save_raw(
+            metadata, raw_transcript, context.get_result("clean"), audio_path,
+        ))
+
+    async def _await_raw_save(
+        self, task: asyncio.Task[list[str]], context: StageContext
+    ) -> list[str] | None:
+        """Get files staged by background save_raw (None: SaveStage rewrites them)."""
+        try:
+            return await task
+        except Exception as e:
+            logger.warning(f"Background raw save failed, retrying in save stage: {e}")
+            await self._discard_raw_save(task, context)
+            return None
+
+    async def _discard_raw_save(
+        self, task: asyncio.Task[list[str]], context: StageContext
+    ) -> None:
+        """Wait for background save_raw and remove its staged files."""
+        # Not cancelled: the copy runs in a worker thread that can't be
+        # interrupted, removing files while it still writes would race
+        await asyncio.gather(task, return_exceptions=True)
+        await FileSaver(self.settings).discard_raw(context.get_result("parse"))
+
     def _build_pipeline(self) -> list[BaseStage]:
         """Build ordered list of pipeline stages."""
         return [
@@ -203,12 +269,14 @@ class PipelineOrchestrator:
         # Start progress ticker
         ticker = None
         if callback:
+            # Ticker passes (status, progress, message, estimated, elapsed)
+            report = partial(self.progress_manager.update_progress, callback)
             estimated = self._estimate_stage_time(stage, context)
             ticker = await self.estimator.start_ticker(
                 stage=status,
                 estimated_seconds=estimated,
                 message=f"Processing: {stage.name}",
-                callback=lambda s, p, m: self.progress_manager.update_progress(callback, s, p, m),
+                callback=report,
             )
 
         try:
@@ -227,7 +295,7 @@ class PipelineOrchestrator:
             await self.estimator.stop_ticker(
                 ticker,
                 status,
-                lambda s, p, m: self.progress_manager.update_progress(callback, s, p, m),
+                report,
                 f"Completed: {stage.name}",
             )
 
@@ -569,3 +637,113 @@ class PipelineOrchestrator:
         context = StageContext(results=results)
         stage = SaveStage(self.settings)
         return await stage.execute(context)
+
+
+if __name__ == "__main__":
+    """Run tests when executed directly."""
+    import sys
+    import tempfile
+    from datetime import date
+
+    from app.models.schemas import TranscriptSegment
+
+    class _FakeStage:
+        """Stage returning a fixed result or raising StageError."""
+
+        status = None
+
+        def __init__(self, name: str, result=None, fail: bool = False):
+            self.name = name
+            self.result = result
+            self.fail = fail
+            self.seen_raw_files: list[str] | None = None
+
+        def should_skip(self, context: StageContext) -> bool:
+            return False
+
+        async def execute(self, context: StageContext):
+            self.seen_raw_files = context.metadata.get("raw_files")
+            if self.fail:
+                raise StageError(self.name, "boom")
+            return self.result
+
+    async def run_tests() -> int:
+        print("\nRunning PipelineOrchestrator tests...\n")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            settings = get_settings().model_copy(update={"archive_dir": tmp_path / "archive"})
+            video = tmp_path / "video.mp4"
+            video.write_text("video")
+            audio = tmp_path / "audio.mp3"
+
+            metadata = VideoMetadata(
+                date=date(2025, 4, 7),
+                event_type="ПШ",
+                stream="SV",
+                title="Test",
+                speaker="Speaker",
+                original_filename=video.name,
+                video_id="2025-04-07_ПШ-SV_test",
+                source_path=video,
+                archive_path=settings.archive_dir / "2025" / "ПШ" / "Test (Speaker)",
+            )
+            raw = RawTranscript(
+                segments=[TranscriptSegment(start=0.0, end=1.0, text="Текст.")],
+                language="ru",
+                duration_seconds=1.0,
+                whisper_model="test",
+            )
+            cleaned = CleanedTranscript(
+                text="Текст.", original_length=6, cleaned_length=6, model_name="test",
+            )
+
+            def pipeline(fail_at: str) -> list[_FakeStage]:
+                return [
+                    _FakeStage("parse", metadata),
+                    _FakeStage("transcribe", (raw, audio)),
+                    _FakeStage("clean", cleaned),
+                    _FakeStage("longread", fail=fail_at == "longread"),
+                    _FakeStage("save", SaveResult(files=[]), fail=fail_at == "save"),
+                ]
+
+            # Test 1: Stage after clean fails -> archive and staging stay empty
+            print("Test 1: Failure after clean leaves no files...", end=" ")
+            audio.write_bytes(b"audio")
+            orchestrator = PipelineOrchestrator(settings)
+            orchestrator._build_pipeline = lambda: pipeline("longread")  # type: ignore[method-assign]
+            try:
+                await orchestrator.process(video)
+                print("FAILED: expected PipelineError")
+                return 1
+            except PipelineError:
+                pass
+            leftovers = [
+                p for p in settings.archive_dir.rglob("*") if not p.is_dir()
+            ] if settings.archive_dir.exists() else []
+            if leftovers or (settings.archive_dir / "2025").exists() or not audio.exists():
+                print(f"FAILED: leftovers={leftovers}, audio={audio.exists()}")
+                return 1
+            print("OK")
+
+            # Test 2: Save stage gets staged names; its failure drops staging too
+            print("Test 2: Save stage receives raw_files...", end=" ")
+            stages = pipeline("save")
+            orchestrator._build_pipeline = lambda: stages  # type: ignore[method-assign]
+            try:
+                await orchestrator.process(video)
+            except PipelineError:
+                pass
+            seen = stages[-1].seen_raw_files
+            if seen != ["transcript_raw.txt", "transcript_cleaned.txt", "audio.mp3"]:
+                print(f"FAILED: {seen}")
+                return 1
+            if any(p.is_file() for p in settings.archive_dir.rglob("*")):
+                print("FAILED: staged files left after save failure")
+                return 1
+            print("OK")
+
+        print("\nAll tests passed!")
+        return 0
+
+    sys.exit(asyncio.run(run_tests()))
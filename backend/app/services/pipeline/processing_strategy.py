@@ -8,6 +8,7 @@ v0.29+: Removed fallback support - errors propagate to caller.
 
 import logging
 import os
+from contextlib import nullcontext
 from dataclasses import dataclass
 from enum import Enum
 from typing import AsyncContextManager
@@ -66,6 +67,11 @@ class ProcessingStrategy:
         # Get client for specific model
         async with strategy.create_client("claude-sonnet-4-6") as client:
             response = await client.generate("...")
+
+        # Reuse one client per provider across several stages
+        strategy.share_clients()
+        ...
+        await strategy.close_shared_clients()
     """
 
     # Known cloud models (prefix-based matching)
@@ -81,6 +87,8 @@ class ProcessingStrategy:
         self.settings = settings
         self._ollama_available: bool | None = None
         self._claude_available: bool | None = None
+        # Provider -> client kept open between create_client() calls
+        self._shared_clients: dict[ProviderType, BaseAIClient] | None = None
 
     def get_provider_type(self, model: str) -> ProviderType:
         """
@@ -185,11 +193,42 @@ class ProcessingStrategy:
         """
         provider = self.get_provider_type(model)
 
+        if self._shared_clients is not None:
+            # Shared client is closed by close_shared_clients(), not by caller
+            client = self._shared_clients.get(provider)
+            if client is None:
+                client = self._new_client(provider)
+                self._shared_clients[provider] = client
+            return nullcontext(client)
+
+        return self._new_client(provider)
+
+    def _new_client(self, provider: ProviderType) -> BaseAIClient:
+        """Create a client owned by the caller."""
         if provider == ProviderType.CLOUD:
             return ClaudeClient.from_settings(self.settings)
         else:
             return OllamaClient.from_settings(self.settings)
 
+    def share_clients(self) -> None:
+        """
+        Reuse one client per provider until close_shared_clients().
+
+        Each stage otherwise opens and closes its own client, losing
+        keep-alive connections (TLS handshake per stage).
+        """
+        if self._shared_clients is None:
+            self._shared_clients = {}
+
+    async def close_shared_clients(self) -> None:
+        """Close shared clients and return to per-call clients."""
+        clients, self._shared_clients = self._shared_clients or {}, None
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close AI client: {e}")
+
 
 if __name__ == "__main__":
     """Run tests when executed directly."""
@@ -243,6 +282,21 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"FAILED: {e}")
 
+        # Test 4: Shared clients are reused and closed once
+        print("\nTest 4: Shared clients...", end=" ")
+        strategy.share_clients()
+        async with strategy.create_client("gemma2:9b") as first:
+            pass
+        async with strategy.create_client("qwen2.5:14b") as second:
+            pass
+        assert first is second, "Expected one client per provider"
+        assert not first.http_client.is_closed, "Shared client closed by caller"
+        await strategy.close_shared_clients()
+        assert first.http_client.is_closed, "Shared client not closed"
+        async with strategy.create_client("gemma2:9b") as third:
+            assert third is not first
+        print("OK")
+
         print("\n" + "=" * 40)
         print("ProcessingStrategy tests completed!")
         return 0
@@ -19,6 +19,19 @@ logger = logging.getLogger(__name__)
 ProgressCallback = Callable[[ProcessingStatus, float, str], Awaitable[None]]
 
 
+def _base_progress_table(
+    order: list[ProcessingStatus],
+    weights: dict[ProcessingStatus, int],
+) -> tuple[dict[ProcessingStatus, int], int]:
+    """Sum of weights preceding each stage in order, and total weight."""
+    table = {}
+    total = 0
+    for stage in order:
+        table[stage] = total
+        total += weights.get(stage, 0)
+    return table, total
+
+
 class ProgressManager:
     """
     Manages progress calculation and reporting for pipeline stages.
@@ -67,6 +80,10 @@ class ProgressManager:
         ProcessingStatus.SAVING,
     ]
 
+    # Base progress per stage, computed once instead of walking STAGE_ORDER
+    # on every ticker update. Stages outside the order count as finished.
+    _BASE_PROGRESS, _TOTAL_WEIGHT = _base_progress_table(STAGE_ORDER, STAGE_WEIGHTS)
+
     def calculate_overall_progress(
         self,
         current_stage: ProcessingStatus,
@@ -82,12 +99,8 @@ class ProgressManager:
         Returns:
             Overall progress (0-100)
         """
-        # Calculate base progress from completed stages
-        base_progress = 0.0
-        for stage in self.STAGE_ORDER:
-            if stage == current_stage:
-                break
-            base_progress += self.STAGE_WEIGHTS.get(stage, 0)
+        # Base progress from completed stages
+        base_progress = self._BASE_PROGRESS.get(current_stage, self._TOTAL_WEIGHT)
 
         # Add current stage progress
         current_weight = self.STAGE_WEIGHTS.get(current_stage, 0)
@@ -101,15 +114,23 @@ class ProgressManager:
         status: ProcessingStatus,
         stage_progress: float,
         message: str,
+        estimated_seconds: float = 0.0,
+        elapsed_seconds: float = 0.0,
     ) -> None:
         """
         Update progress via callback.
 
+        Signature matches ProgressEstimator ticker callback, so
+        partial(manager.update_progress, callback) can be passed
+        to start_ticker/stop_ticker directly.
+
         Args:
             callback: Progress callback (may be None)
             status: Current processing status
             stage_progress: Progress within current stage (0-100)
             message: Human-readable status message
+            estimated_seconds: Ticker estimate (unused, not reported)
+            elapsed_seconds: Ticker elapsed time (unused, not reported)
         """
         if callback is None:
             return
@@ -213,6 +234,29 @@ if __name__ == "__main__":
         assert longread_idx < chunking_idx, "LONGREAD must come before CHUNKING"
         print("OK")
 
+        # Test 10: Ticker-style call (with timing args) via partial
+        print("Test 10: Ticker-style call via partial...", end=" ")
+        from functools import partial
+        received.clear()
+        report = partial(manager.update_progress, test_callback)
+        await report(ProcessingStatus.CLEANING, 50, "Tick", 340.0, 170.0)
+        assert received[-1] == (ProcessingStatus.CLEANING, 43, "Tick"), received[-1]
+        print("OK")
+
+        # Test 11: Table matches walking STAGE_ORDER (incl. unknown stage)
+        print("Test 11: Base progress table...", end=" ")
+        for status in ProcessingStatus:
+            walked = 0
+            for stage in manager.STAGE_ORDER:
+                if stage == status:
+                    break
+                walked += manager.STAGE_WEIGHTS.get(stage, 0)
+            for pct in (0, 37.5, 100):
+                expected = min(walked + pct / 100 * manager.STAGE_WEIGHTS.get(status, 0), 100)
+                got = manager.calculate_overall_progress(status, pct)
+                assert got == expected, f"{status}: expected {expected}, got {got}"
+        print("OK")
+
         print("\n" + "=" * 40)
         print("All ProgressManager tests passed!")
         return 0
@@ -5,6 +5,7 @@ Saves processing results to the archive directory structure.
 v0.62+: Pure file save, no LLM. Descriptions are in TranscriptChunks.
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -35,11 +36,11 @@ logger = logging.getLogger(__name__)
 # Pipeline version for tracking
 PIPELINE_VERSION = "1.0.0"
 
-# Russian month names for date formatting
-RUSSIAN_MONTHS = [
-    "", "января", "февраля", "марта", "апреля", "мая", "июня",
-    "июля", "августа", "сентября", "октября", "ноября", "декабря"
-]
+# Russian month names for date formatting (index: month - 1)
+RUSSIAN_MONTHS: tuple[str, ...] = (
+    "января", "февраля", "марта", "апреля", "мая", "июня",
+    "июля", "августа", "сентября", "октября", "ноября", "декабря",
+)
 
 
 class FileSaver:
@@ -90,6 +91,50 @@ class FileSaver:
             chunks, longread, summary, audio_path
         )
 
+    async def save_raw(
+        self,
+        metadata: VideoMetadata,
+        raw_transcript: RawTranscript,
+        cleaned_transcript: CleanedTranscript,
+        audio_path: Path | None = None,
+    ) -> list[str]:
+        """
+        Stage artifacts that are final right after cleaning.
+
+        Raw and cleaned transcripts and the audio copy do not depend on
+        longread/summary/chunks, so process() runs this in a worker thread
+        while LLM stages are still working. Files go to a staging directory
+        (archive_dir/.staging/{video_id}, same filesystem as the archive)
+        and appear in the archive only when save_educational/save_leadership
+        gets the returned names as raw_files. If the pipeline fails,
+        discard_raw() removes them; the temp audio is left in place.
+
+        Args:
+            metadata: Video metadata
+            raw_transcript: Raw transcript from Whisper
+            cleaned_transcript: Cleaned transcript after LLM processing
+            audio_path: Path to extracted audio file (optional)
+
+        Returns:
+            List of staged file names
+        """
+        return await asyncio.to_thread(
+            self._save_raw_files,
+            self._staging_path(metadata), raw_transcript, cleaned_transcript,
+            audio_path, False,
+        )
+
+    async def discard_raw(self, metadata: VideoMetadata) -> None:
+        """
+        Remove files staged by save_raw() (pipeline failed before save).
+
+        Args:
+            metadata: Video metadata
+        """
+        await asyncio.to_thread(
+            shutil.rmtree, self._staging_path(metadata), ignore_errors=True
+        )
+
     async def save_educational(
         self,
         metadata: VideoMetadata,
@@ -100,6 +145,7 @@ class FileSaver:
         summary: Summary,
         audio_path: Path | None = None,
         slides_extraction: SlidesExtractionResult | None = None,
+        raw_files: list[str] | None = None,
     ) -> SaveResult:
         """
         Save educational content results to archive.
@@ -115,6 +161,7 @@ class FileSaver:
             summary: Condensed summary (конспект)
             audio_path: Path to extracted audio file (optional)
             slides_extraction: Slides extraction result (optional)
+            raw_files: Files staged by save_raw(), moved into archive (optional)
 
         Returns:
             SaveResult with created file names
@@ -152,18 +199,14 @@ class FileSaver:
         summary_path = self._save_summary_md(archive_path, summary, summary_filename)
         created_files.append(summary_path.name)
 
-        # Save raw transcript
-        raw_path = self._save_raw_transcript(archive_path, raw_transcript)
-        created_files.append(raw_path.name)
-
-        # Save cleaned transcript
-        cleaned_path = self._save_cleaned_transcript(archive_path, cleaned_transcript)
-        created_files.append(cleaned_path.name)
-
-        # Copy audio file if provided
-        if audio_path and audio_path.exists():
-            audio_dest = self._copy_audio(audio_path, archive_path)
-            created_files.append(audio_dest.name)
+        # Raw/cleaned transcripts and audio (may be saved already by save_raw)
+        if raw_files is None:
+            raw_files = self._save_raw_files(
+                archive_path, raw_transcript, cleaned_transcript, audio_path,
+            )
+        else:
+            self._commit_raw_files(metadata, raw_files, audio_path)
+        created_files.extend(raw_files)
 
         # Move video file
         video_path = self._move_video(metadata.source_path, archive_path)
@@ -182,6 +225,7 @@ class FileSaver:
         story: Story,
         audio_path: Path | None = None,
         slides_extraction: SlidesExtractionResult | None = None,
+        raw_files: list[str] | None = None,
     ) -> SaveResult:
         """
         Save leadership content results to archive.
@@ -196,6 +240,7 @@ class FileSaver:
             story: Leadership story (8 blocks)
             audio_path: Path to extracted audio file (optional)
             slides_extraction: Slides extraction result (optional)
+            raw_files: Files staged by save_raw(), moved into archive (optional)
 
         Returns:
             SaveResult with created file names
@@ -228,18 +273,14 @@ class FileSaver:
         story_path = self._save_story_md(archive_path, story, story_filename)
         created_files.append(story_path.name)
 
-        # Save raw transcript
-        raw_path = self._save_raw_transcript(archive_path, raw_transcript)
-        created_files.append(raw_path.name)
-
-        # Save cleaned transcript
-        cleaned_path = self._save_cleaned_transcript(archive_path, cleaned_transcript)
-        created_files.append(cleaned_path.name)
-
-        # Copy audio file if provided
-        if audio_path and audio_path.exists():
-            audio_dest = self._copy_audio(audio_path, archive_path)
-            created_files.append(audio_dest.name)
+        # Raw/cleaned transcripts and audio (may be saved already by save_raw)
+        if raw_files is None:
+            raw_files = self._save_raw_files(
+                archive_path, raw_transcript, cleaned_transcript, audio_path,
+            )
+        else:
+            self._commit_raw_files(metadata, raw_files, audio_path)
+        created_files.extend(raw_files)
 
         # Move video file
         video_path = self._move_video(metadata.source_path, archive_path)
@@ -545,7 +586,8 @@ class FileSaver:
         """
         Save longread document as Markdown.
 
-        Uses the Longread.to_markdown() method for consistent formatting.
+        Uses Longread.stream_to_markdown() — same output as to_markdown(),
+        written section by section.
 
         Args:
             archive_path: Archive directory path
@@ -557,10 +599,7 @@ class FileSaver:
         """
         file_path = archive_path / filename
 
-        content = longread.to_markdown()
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        longread.stream_to_markdown(file_path)
 
         logger.debug(f"Saved longread MD: {file_path}")
 
@@ -626,6 +665,71 @@ class FileSaver:
 
         return file_path
 
+    def _save_raw_files(
+        self,
+        archive_path: Path,
+        raw_transcript: RawTranscript,
+        cleaned_transcript: CleanedTranscript,
+        audio_path: Path | None,
+        remove_audio_source: bool = True,
+    ) -> list[str]:
+        """
+        Save raw transcript, cleaned transcript and audio copy.
+
+        Args:
+            archive_path: Archive (or staging) directory path
+            raw_transcript: Raw transcript
+            cleaned_transcript: Cleaned transcript
+            audio_path: Path to extracted audio file (optional)
+            remove_audio_source: Delete temp audio after copying
+
+        Returns:
+            List of created file names
+        """
+        archive_path.mkdir(parents=True, exist_ok=True)
+
+        created_files = [
+            self._save_raw_transcript(archive_path, raw_transcript).name,
+            self._save_cleaned_transcript(archive_path, cleaned_transcript).name,
+        ]
+
+        # Copy audio file if provided
+        if audio_path and audio_path.exists():
+            audio_dest = self._copy_audio(
+                audio_path, archive_path, remove_source=remove_audio_source
+            )
+            created_files.append(audio_dest.name)
+
+        return created_files
+
+    def _commit_raw_files(
+        self,
+        metadata: VideoMetadata,
+        raw_files: list[str],
+        audio_path: Path | None,
+    ) -> None:
+        """
+        Move files staged by save_raw() into the archive directory.
+
+        Args:
+            metadata: Video metadata
+            raw_files: Staged file names
+            audio_path: Temp audio, deleted now that its copy is archived
+        """
+        staging_path = self._staging_path(metadata)
+        for name in raw_files:
+            shutil.move(str(staging_path / name), str(metadata.archive_path / name))
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+        if audio_path:
+            audio_path.unlink(missing_ok=True)
+
+        logger.debug(f"Moved staged files: {staging_path} -> {metadata.archive_path}")
+
+    def _staging_path(self, metadata: VideoMetadata) -> Path:
+        """Staging directory for save_raw(); skipped by archive listing."""
+        return self.settings.archive_dir / ".staging" / metadata.video_id
+
     def _save_raw_transcript(
         self,
         archive_path: Path,
@@ -696,13 +800,16 @@ class FileSaver:
 
         return dest_path
 
-    def _copy_audio(self, source: Path, dest_dir: Path) -> Path:
+    def _copy_audio(
+        self, source: Path, dest_dir: Path, remove_source: bool = True
+    ) -> Path:
         """
         Copy audio file to archive directory as audio.mp3.
 
         Args:
             source: Source audio path (temp file)
             dest_dir: Destination directory
+            remove_source: Delete temp file after copying
 
         Returns:
             Path to copied file
@@ -712,7 +819,8 @@ class FileSaver:
         shutil.copy2(str(source), str(dest_path))
 
         # Clean up temp file
-        source.unlink(missing_ok=True)
+        if remove_source:
+            source.unlink(missing_ok=True)
 
         logger.debug(f"Copied audio: {source} -> {dest_path}")
 
@@ -745,7 +853,7 @@ class FileSaver:
         Returns:
             Formatted date string
         """
-        return f"{d.day} {RUSSIAN_MONTHS[d.month]} {d.year}"
+        return f"{d.day} {RUSSIAN_MONTHS[d.month - 1]} {d.year}"
 
     @staticmethod
     def _build_md_filename(metadata: "VideoMetadata", suffix: str) -> str:
@@ -999,6 +1107,50 @@ if __name__ == "__main__":
                 print(f"  Created files: {files}")
                 print(f"  Archive path: {archive_dir}")
 
+                # Test 5: save_raw stages files, save_educational moves them in
+                print("Test 5: save_raw + save_educational(raw_files)...", end=" ")
+                video_file.write_text("mock video content")
+                audio_file = temp_path / "audio_tmp.mp3"
+                audio_file.write_bytes(b"mock audio")
+                staging_saver = FileSaver(
+                    settings.model_copy(update={"archive_dir": temp_path / "archive2"})
+                )
+                archive_dir2 = temp_path / "archive2" / "2025" / "04" / "ПШ.SV" / "Test Video"
+                metadata2 = metadata.model_copy(update={"archive_path": archive_dir2})
+                raw_files = await staging_saver.save_raw(
+                    metadata2, raw_transcript, cleaned_transcript, audio_file,
+                )
+                assert raw_files == [
+                    "transcript_raw.txt", "transcript_cleaned.txt", "audio.mp3",
+                ], raw_files
+                assert not archive_dir2.exists(), "save_raw wrote into archive"
+                assert audio_file.exists(), "Temp audio removed before commit"
+                result2 = await staging_saver.save_educational(
+                    metadata2, raw_transcript, cleaned_transcript,
+                    chunks, longread, summary, audio_file, raw_files=raw_files,
+                )
+                assert sorted(result2.files) == sorted(files + ["audio.mp3"]), result2.files
+                assert (archive_dir2 / "audio.mp3").read_bytes() == b"mock audio"
+                assert (archive_dir2 / "transcript_raw.txt").exists()
+                assert not audio_file.exists(), "Temp audio not removed"
+                assert not staging_saver._staging_path(metadata2).exists()
+                print("OK")
+
+                # Test 6: discard_raw leaves nothing behind (pipeline failed)
+                print("Test 6: save_raw + discard_raw...", end=" ")
+                audio_file.write_bytes(b"mock audio")
+                metadata3 = metadata.model_copy(update={
+                    "archive_path": temp_path / "archive2" / "2025" / "05" / "ПШ" / "Failed",
+                })
+                await staging_saver.save_raw(
+                    metadata3, raw_transcript, cleaned_transcript, audio_file,
+                )
+                await staging_saver.discard_raw(metadata3)
+                assert not metadata3.archive_path.exists()
+                assert not staging_saver._staging_path(metadata3).exists()
+                assert audio_file.exists(), "Temp audio must survive a failed run"
+                print("OK")
+
         except Exception as e:
             print(f"FAILED: {e}")
             import traceback
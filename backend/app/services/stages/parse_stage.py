@@ -85,7 +85,7 @@ class ParseStage(BaseStage):
             metadata.speaker_info = parse_speakers(text)
             metadata.language = detect_language(text)
         else:
-            metadata.duration_seconds = get_media_duration(video_path)
+            metadata.duration_seconds = await get_media_duration(video_path)
             if metadata.duration_seconds is None:
                 metadata.duration_seconds = estimate_duration_from_size(video_path)
 
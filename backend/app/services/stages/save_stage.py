@@ -79,6 +79,8 @@ class SaveStage(BaseStage):
         raw_transcript, audio_path = context.get_result("transcribe")
         cleaned: CleanedTranscript = context.get_result("clean")
         chunks = context.get_result("chunk")
+        # Files already written by FileSaver.save_raw() during LLM stages
+        raw_files: list[str] | None = context.metadata.get("raw_files")
 
         # Get slides extraction result if available
         slides_extraction: SlidesExtractionResult | None = None
@@ -97,6 +99,7 @@ class SaveStage(BaseStage):
                     story,
                     audio_path,
                     slides_extraction,
+                    raw_files,
                 )
             else:
                 # Educational: longread + summary
@@ -111,6 +114,7 @@ class SaveStage(BaseStage):
                     summary,
                     audio_path,
                     slides_extraction,
+                    raw_files,
                 )
         except Exception as e:
             raise StageError(self.name, f"Save failed: {e}", e)
@@ -32,7 +32,7 @@ logger = logging.getLogger(__name__)
 perf_logger = logging.getLogger("app.perf")
 
 # Valid access_level values
-VALID_ACCESS_LEVELS = ["consultant", "leader", "personal"]
+VALID_ACCESS_LEVELS = frozenset({"consultant", "leader", "personal"})
 
 # Valid speed values
 VALID_SPEEDS = ["быстро", "средне", "долго", "очень долго"]
@@ -29,20 +29,20 @@ from app.utils.speaker_utils import build_speaker_context
 logger = logging.getLogger(__name__)
 perf_logger = logging.getLogger("app.perf")
 
-# Russian month names for date formatting
-RUSSIAN_MONTHS = [
-    "", "января", "февраля", "марта", "апреля", "мая", "июня",
-    "июля", "августа", "сентября", "октября", "ноября", "декабря"
-]
+# Russian month names for date formatting (index: month - 1)
+RUSSIAN_MONTHS: tuple[str, ...] = (
+    "января", "февраля", "марта", "апреля", "мая", "июня",
+    "июля", "августа", "сентября", "октября", "ноября", "декабря",
+)
 
 # Valid topic_area values for classification
-VALID_TOPIC_AREAS = [
+VALID_TOPIC_AREAS = frozenset({
     "продажи", "спонсорство", "лидерство",
-    "мотивация", "инструменты", "маркетинг-план"
-]
+    "мотивация", "инструменты", "маркетинг-план",
+})
 
 # Valid access_level values
-VALID_ACCESS_LEVELS = ["consultant", "leader", "personal"]
+VALID_ACCESS_LEVELS = frozenset({"consultant", "leader", "personal"})
 
 # Default max input chars (for truncation if needed)
 DEFAULT_MAX_INPUT_CHARS = 50000
@@ -302,7 +302,7 @@ class SummaryGenerator:
         Returns:
             Complete prompt for LLM
         """
-        date_formatted = f"{metadata.date.day} {RUSSIAN_MONTHS[metadata.date.month]} {metadata.date.year}"
+        date_formatted = f"{metadata.date.day} {RUSSIAN_MONTHS[metadata.date.month - 1]} {metadata.date.year}"
         language = language_override or metadata.language
 
         prompt_parts = [
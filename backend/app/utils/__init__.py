@@ -12,6 +12,7 @@ Modules:
     media_utils: Media file handling (duration, type detection) (v0.28+)
     pricing_utils: LLM cost calculation (v0.42+)
     pdf_utils: PDF to image conversion for slides (v0.50+)
+    concurrency_utils: Adaptive concurrency limit for LLM requests (v0.86+)
 """
 
 from app.utils.chunk_utils import (
@@ -19,8 +20,14 @@ from app.utils.chunk_utils import (
     generate_chunk_id,
     validate_cyrillic_ratio,
 )
+from app.utils.concurrency_utils import AdaptiveSemaphore
 from app.utils.h2_chunker import chunk_by_h2
-from app.utils.json_utils import extract_and_parse_json, extract_json, parse_json_safe
+from app.utils.json_utils import (
+    JsonStreamScanner,
+    extract_and_parse_json,
+    extract_json,
+    parse_json_safe,
+)
 from app.utils.language_utils import build_language_context, detect_language
 from app.utils.media_utils import (
     TRANSCRIPT_EXTENSIONS,
@@ -50,6 +57,7 @@ __all__ = [
     "extract_and_parse_json",
     "extract_json",
     "parse_json_safe",
+    "JsonStreamScanner",
     # token_utils
     "estimate_tokens",
     "calculate_num_predict",
@@ -77,4 +85,6 @@ __all__ = [
     # language_utils
     "detect_language",
     "build_language_context",
+    # concurrency_utils
+    "AdaptiveSemaphore",
 ]
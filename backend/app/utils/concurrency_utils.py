@@ -0,0 +1,266 @@
+"""
+Concurrency limiting utilities for parallel LLM requests.
+
+AdaptiveSemaphore works like asyncio.Semaphore, but its limit follows the
+provider's capacity: halves on rate-limit errors (429/503) and grows back
+by one after a run of successful calls (AIMD, as in TCP congestion control).
+
+Example:
+    from app.utils.concurrency_utils import AdaptiveSemaphore
+
+    limiter = AdaptiveSemaphore(max_permits=8)
+
+    async with limiter:
+        try:
+            response = await client.generate(prompt)
+            await limiter.on_success()
+        except AIClientResponseError as e:
+            if e.status_code == 429:
+                limiter.on_rate_limit()
+            raise
+
+retry_on_rate_limit() wraps one call with this bookkeeping plus backoff:
+
+    async with limiter:
+        response = await retry_on_rate_limit(lambda: client.generate(prompt), limiter)
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses treated as rate limiting and retries before giving up
+RATE_LIMIT_STATUS_CODES = frozenset({429, 503})
+RATE_LIMIT_RETRIES = 3
+
+
+class AdaptiveSemaphore:
+    """
+    Semaphore with a limit that adapts to rate limiting.
+
+    Attributes:
+        max_permits: Upper bound for the limit
+        limit: Current number of concurrent holders allowed
+    """
+
+    def __init__(self, max_permits: int):
+        """
+        Initialize semaphore.
+
+        Args:
+            max_permits: Maximum concurrent holders (initial limit)
+        """
+        self.max_permits = max(1, max_permits)
+        self.limit = self.max_permits
+        self._active = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until an active slot is available under current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self) -> None:
+        """Free a slot and wake up waiters."""
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def on_rate_limit(self) -> None:
+        """Provider is overloaded: halve the limit (not below 1)."""
+        new_limit = max(1, self.limit // 2)
+        if new_limit != self.limit:
+            logger.warning(
+                f"Rate limited: parallel LLM requests {self.limit} -> {new_limit}"
+            )
+        self.limit = new_limit
+        self._successes = 0
+
+    async def on_success(self) -> None:
+        """
+        Successful call: after `limit` successes in a row, allow one more.
+
+        Waiters are notified at once, so the new slot is used without
+        waiting for the next release.
+        """
+        if self.limit >= self.max_permits:
+            return
+        self._successes += 1
+        if self._successes >= self.limit:
+            async with self._condition:
+                self.limit += 1
+                self._successes = 0
+                self._condition.notify_all()
+            logger.debug("Parallel LLM requests limit raised to %d", self.limit)
+
+    async def __aenter__(self) -> "AdaptiveSemaphore":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
+
+
+async def retry_on_rate_limit(
+    coro_factory: Callable[[], Awaitable[T]],
+    limiter: AdaptiveSemaphore,
+    retries: int = RATE_LIMIT_RETRIES,
+) -> T:
+    """
+    Await coro_factory(), retrying rate-limit errors with backoff and jitter.
+
+    An error counts as rate limiting when its status_code attribute is in
+    RATE_LIMIT_STATUS_CODES (e.g. AIClientResponseError). Each one halves
+    the limiter, each success feeds it. The slot itself is held by the
+    caller: the limiter is not acquired here.
+
+    Args:
+        coro_factory: Creates a fresh awaitable for every attempt
+        limiter: Semaphore to adapt
+        retries: Rate-limited attempts before the last one
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        Exception: Non-rate-limit errors at once, any error of the last attempt
+    """
+    for attempt in range(retries):
+        try:
+            result = await coro_factory()
+            await limiter.on_success()
+            return result
+        except Exception as e:
+            status_code = getattr(e, "status_code", None)
+            if status_code not in RATE_LIMIT_STATUS_CODES:
+                raise
+            limiter.on_rate_limit()
+            delay = random.uniform(0.5, 2.0) * 2 ** attempt
+            logger.warning(
+                "Rate limited (HTTP %s), retry %d/%d in %.1fs",
+                status_code, attempt + 1, retries, delay,
+            )
+            await asyncio.sleep(delay)
+
+    # Last attempt: errors go to the caller
+    result = await coro_factory()
+    await limiter.on_success()
+    return result
+
+
+if __name__ == "__main__":
+    import sys
+
+    async def run_tests() -> int:
+        print("\nRunning concurrency_utils tests...\n")
+        errors = 0
+
+        # Test 1: Limit is respected
+        print("Test 1: Limit is respected...", end=" ")
+        limiter = AdaptiveSemaphore(max_permits=3)
+        peak = 0
+        active = 0
+
+        async def job() -> None:
+            nonlocal peak, active
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(job() for _ in range(10)))
+        if peak == 3:
+            print("OK")
+        else:
+            print(f"FAILED: peak {peak}")
+            errors += 1
+
+        # Test 2: Halves on rate limit, regrows on success
+        print("Test 2: Halve and regrow...", end=" ")
+        limiter = AdaptiveSemaphore(max_permits=8)
+        limiter.on_rate_limit()
+        limiter.on_rate_limit()
+        halved = limiter.limit
+        for _ in range(2 + 3):
+            await limiter.on_success()
+        if halved == 2 and limiter.limit == 4:
+            print("OK")
+        else:
+            print(f"FAILED: halved={halved}, regrown={limiter.limit}")
+            errors += 1
+
+        # Test 3: Rate limits are retried, other errors are not
+        print("Test 3: retry_on_rate_limit...", end=" ")
+
+        class _StatusError(Exception):
+            def __init__(self, status_code: int):
+                super().__init__(f"HTTP {status_code}")
+                self.status_code = status_code
+
+        limiter = AdaptiveSemaphore(max_permits=4)
+        calls = 0
+
+        async def flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise _StatusError(429)
+            return "ok"
+
+        async def broken() -> str:
+            raise _StatusError(500)
+
+        random.seed(0)
+        real_sleep = asyncio.sleep
+
+        async def no_sleep(_delay: float) -> None:
+            await real_sleep(0)
+
+        asyncio.sleep = no_sleep  # type: ignore[assignment]
+        try:
+            result = await retry_on_rate_limit(flaky, limiter)
+            try:
+                await retry_on_rate_limit(broken, limiter)
+                not_retried = False
+            except _StatusError:
+                not_retried = True
+        finally:
+            asyncio.sleep = real_sleep  # type: ignore[assignment]
+        if result == "ok" and calls == 2 and limiter.limit == 2 and not_retried:
+            print("OK")
+        else:
+            print(f"FAILED: result={result}, calls={calls}, limit={limiter.limit}")
+            errors += 1
+
+        # Test 4: Raised limit wakes a waiter without any release
+        print("Test 4: on_success wakes waiters...", end=" ")
+        limiter = AdaptiveSemaphore(max_permits=2)
+        limiter.on_rate_limit()
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        await limiter.on_success()
+        try:
+            await asyncio.wait_for(waiter, timeout=1.0)
+            print("OK")
+        except asyncio.TimeoutError:
+            print("FAILED: waiter not woken")
+            errors += 1
+
+        print("\n" + "=" * 40)
+        if errors == 0:
+            print("All tests passed!")
+            return 0
+        print(f"{errors} test(s) failed!")
+        return 1
+
+    sys.exit(asyncio.run(run_tests()))
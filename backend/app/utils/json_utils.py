@@ -4,6 +4,10 @@ JSON extraction and parsing utilities for LLM responses.
 LLMs often return JSON wrapped in markdown code blocks or with
 surrounding text. These utilities handle extraction and safe parsing.
 
+Parsing uses orjson when installed (C parser, accepts str directly),
+otherwise stdlib json. All services (outline, longread, summary, ...)
+parse LLM responses through extract_and_parse_json and share this path.
+
 Example:
     from app.utils.json_utils import extract_json, parse_json_safe
 
@@ -20,10 +24,23 @@ import logging
 import re
 from typing import Any, Literal, TypeVar
 
+try:
+    import orjson
+
+    _loads = orjson.loads  # C parser; orjson.JSONDecodeError subclasses json's
+except ImportError:  # optional speedup, stdlib is enough
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Shared decoder for raw_decode() fast path in extract_and_parse_json
+_DECODER = json.JSONDecoder()
+
+# Markdown code block around JSON (```json ... ```), compiled once
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
 
 def extract_json(
     text: str,
@@ -52,15 +69,48 @@ def extract_json(
         >>> extract_json('Here is the data: [1, 2, 3] done', json_type="array")
         '[1, 2, 3]'
     """
-    if not text:
+    cleaned, start_idx, open_bracket, close_bracket = _locate_json(text, json_type)
+    if start_idx == -1:
         return ""
 
+    return _find_matching_bracket(cleaned[start_idx:], open_bracket, close_bracket)
+
+
+def _locate_json(
+    text: str,
+    json_type: Literal["object", "array", "auto"],
+) -> tuple[str, int, str, str]:
+    """
+    Find where JSON starts in LLM response.
+
+    Args:
+        text: Raw LLM response
+        json_type: Type of JSON to look for ("object", "array", "auto")
+
+    Returns:
+        Tuple (cleaned_text, start_idx, open_bracket, close_bracket),
+        start_idx is -1 if no JSON found
+    """
+    if not text:
+        return "", -1, "{", "}"
+
     cleaned = text.strip()
 
+    # Fast path: bare JSON (typical when the prompt asks for JSON only)
+    first_char = cleaned[:1]
+    if first_char == "{" and json_type != "array":
+        return cleaned, 0, "{", "}"
+    if first_char == "[" and json_type != "object":
+        return cleaned, 0, "[", "]"
+
     # Try to extract from markdown code block first
-    code_block_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", cleaned)
-    if code_block_match:
-        cleaned = code_block_match.group(1).strip()
+    if cleaned.startswith("```") and cleaned.endswith("```") and cleaned.count("```") == 2:
+        # Whole response is one fenced block (typical): strip fences without regex
+        cleaned = cleaned[3:-3].removeprefix("json").strip()
+    elif "```" in cleaned:
+        code_block_match = _CODE_BLOCK_RE.search(cleaned)
+        if code_block_match:
+            cleaned = code_block_match.group(1).strip()
 
     # Determine which brackets to look for
     if json_type == "auto":
@@ -69,7 +119,7 @@ def extract_json(
         arr_idx = cleaned.find("[")
 
         if obj_idx == -1 and arr_idx == -1:
-            return ""
+            return cleaned, -1, "{", "}"
         elif obj_idx == -1:
             json_type = "array"
         elif arr_idx == -1:
@@ -83,16 +133,7 @@ def extract_json(
     else:
         open_bracket, close_bracket = "[", "]"
 
-    # If already starts with correct bracket, validate and return
-    if cleaned.startswith(open_bracket):
-        return _find_matching_bracket(cleaned, open_bracket, close_bracket)
-
-    # Find the JSON boundaries
-    start_idx = cleaned.find(open_bracket)
-    if start_idx == -1:
-        return ""
-
-    return _find_matching_bracket(cleaned[start_idx:], open_bracket, close_bracket)
+    return cleaned, cleaned.find(open_bracket), open_bracket, close_bracket
 
 
 def _find_matching_bracket(text: str, open_bracket: str, close_bracket: str) -> str:
@@ -141,6 +182,56 @@ def _find_matching_bracket(text: str, open_bracket: str, close_bracket: str) ->
     return text
 
 
+class JsonStreamScanner:
+    """
+    Incremental detector of the end of the first top-level JSON value.
+
+    Fed with chunks of a streamed LLM response; reports when the first
+    {...} or [...] is closed, so generation can be stopped early.
+    Brackets inside JSON strings are ignored.
+
+    Example:
+        scanner = JsonStreamScanner()
+        async for chunk in client.generate_stream(prompt):
+            chunks.append(chunk)
+            if scanner.feed(chunk):
+                break
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escape_next = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Scan next chunk.
+
+        Returns:
+            True once the first top-level JSON value is complete
+        """
+        for char in chunk:
+            if self._escape_next:
+                self._escape_next = False
+            elif self._in_string:
+                if char == "\\":
+                    self._escape_next = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._started:
+                    self._in_string = True
+            elif char in "{[":
+                self._started = True
+                self._depth += 1
+            elif char in "}]" and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        return False
+
+
 def extract_and_parse_json(
     text: str,
     json_type: Literal["object", "array", "auto"] = "auto",
@@ -164,7 +255,28 @@ def extract_and_parse_json(
         >>> extract_and_parse_json('```json\\n{"key": "value"}\\n```', default={})
         {'key': 'value'}
     """
-    json_str = extract_json(text, json_type=json_type)
+    cleaned, start_idx, open_bracket, close_bracket = _locate_json(text, json_type)
+    if start_idx == -1:
+        logger.warning("No JSON found in LLM response")
+        return default
+
+    # Fastest path: response is exactly JSON (typical inside ```json fence)
+    candidate = cleaned[start_idx:]
+    if candidate.endswith(close_bracket):
+        try:
+            return _loads(candidate)
+        except json.JSONDecodeError:
+            pass
+
+    # Fast path: valid JSON is parsed in C in one pass, trailing text ignored
+    try:
+        data, _ = _DECODER.raw_decode(cleaned, start_idx)
+        return data
+    except json.JSONDecodeError:
+        pass
+
+    # Broken JSON: cut by bracket matching and let parse_json_safe repair it
+    json_str = _find_matching_bracket(candidate, open_bracket, close_bracket)
     if not json_str:
         logger.warning("No JSON found in LLM response")
         return default
@@ -204,7 +316,7 @@ def parse_json_safe(
         return default
 
     try:
-        return json.loads(json_str)
+        return _loads(json_str)
     except json.JSONDecodeError as e:
         if log_errors:
             preview = json_str[:200] + "..." if len(json_str) > 200 else json_str
@@ -325,6 +437,24 @@ if __name__ == "__main__":
         print(f"FAILED: got {result}")
         errors += 1
 
+    # Test 11: Extract and parse with trailing prose
+    print("Test 11: Extract and parse with trailing prose...", end=" ")
+    result = extract_and_parse_json('Ответ: {"a": "}", "b": [1]} и ещё {текст}', default={})
+    if result == {"a": "}", "b": [1]}:
+        print("OK")
+    else:
+        print(f"FAILED: got {result}")
+        errors += 1
+
+    # Test 12: Extract and parse broken JSON falls back to repair
+    print("Test 12: Extract and parse broken JSON (repair)...", end=" ")
+    result = extract_and_parse_json('```json\n{"a": 1, "b": 2,}\n```', default={})
+    if result == {"a": 1, "b": 2}:
+        print("OK")
+    else:
+        print(f"FAILED: got {result}")
+        errors += 1
+
     print("\n" + "=" * 40)
     if errors == 0:
         print("All tests passed!")
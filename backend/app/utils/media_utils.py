@@ -7,12 +7,21 @@ Provides common functions for media file operations:
 - Media type detection (audio vs video)
 """
 
+import asyncio
+import json
 import logging
-import subprocess
+from collections import OrderedDict
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+FFPROBE_TIMEOUT = 30
+
+# ffprobe results keyed by (path, size, mtime_ns): step-by-step mode and
+# reprocessing probe the same file several times
+DURATION_CACHE_SIZE = 256
+_duration_cache: OrderedDict[tuple[str, int, int], float] = OrderedDict()
+
 # Supported media extensions
 AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".flac", ".aac", ".ogg"})
 VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".mov", ".webm"})
@@ -55,10 +64,12 @@ def is_video_file(file_path: Path) -> bool:
     return file_path.suffix.lower() in VIDEO_EXTENSIONS
 
 
-def get_media_duration(media_path: Path) -> float | None:
+async def get_media_duration(media_path: Path) -> float | None:
     """Get media duration using ffprobe.
 
-    Works for both audio and video files.
+    Works for both audio and video files. ffprobe runs as an asyncio
+    subprocess, so the event loop isn't blocked while it reads the file.
+    Results are cached until the file's size or mtime changes.
 
     Args:
         media_path: Path to media file
@@ -67,29 +78,85 @@ def get_media_duration(media_path: Path) -> float | None:
         Duration in seconds, or None if ffprobe fails
     """
     try:
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "csv=p=0",
-                str(media_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        st = media_path.stat()
+    except OSError as e:
+        logger.warning(f"ffprobe failed for {media_path.name}: {e}")
+        return None
+
+    key = (str(media_path), st.st_size, st.st_mtime_ns)
+    cached = _duration_cache.get(key)
+    if cached is not None:
+        _duration_cache.move_to_end(key)
+        return cached
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration:stream=duration",
+            "-of",
+            "json",
+            str(media_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return float(result.stdout.strip())
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=FFPROBE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        if proc.returncode != 0:
+            logger.warning(
+                f"ffprobe failed for {media_path.name}: "
+                f"{stderr.decode(errors='replace').strip()}"
+            )
+            return None
+        duration = _parse_ffprobe_duration(stdout)
+        if duration is not None:
+            _duration_cache[key] = duration
+            if len(_duration_cache) > DURATION_CACHE_SIZE:
+                _duration_cache.popitem(last=False)
+            return duration
+        logger.warning(f"ffprobe returned no duration for {media_path.name}")
     except Exception as e:
         logger.warning(f"ffprobe failed for {media_path.name}: {e}")
 
     return None
 
 
+def _parse_ffprobe_duration(stdout: bytes) -> float | None:
+    """Extract duration from ffprobe JSON output.
+
+    Container duration is preferred. Some MKV/fragmented MP4 files don't
+    have it, then the longest stream duration is used.
+
+    Args:
+        stdout: ffprobe output with format and stream durations
+
+    Returns:
+        Duration in seconds, or None if no duration reported
+    """
+    data = json.loads(stdout or b"{}")
+    candidates = [data.get("format", {}).get("duration")]
+    stream_durations = [s.get("duration") for s in data.get("streams", [])]
+
+    for group in candidates, stream_durations:
+        durations = []
+        for raw in group:
+            try:
+                durations.append(float(raw))
+            except (TypeError, ValueError):  # missing or "N/A"
+                continue
+        if durations:
+            return max(durations)
+    return None
+
+
 def estimate_duration_from_size(file_path: Path) -> float:
     """Estimate media duration from file size.
 
@@ -24,6 +24,10 @@ logger = logging.getLogger(__name__)
 # Cache for model pricing (loaded once)
 _pricing_cache: dict[str, dict[str, float]] | None = None
 
+# Prompt cache rates relative to input price (Anthropic prompt caching)
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
 
 class ModelPricing(TypedDict):
     """Pricing per 1M tokens."""
@@ -62,14 +66,18 @@ def calculate_cost(
     model_name: str,
     input_tokens: int,
     output_tokens: int,
+    cache_write_tokens: int = 0,
+    cache_read_tokens: int = 0,
 ) -> float:
     """
     Calculate cost for a model API call.
 
     Args:
         model_name: Model identifier
-        input_tokens: Number of input tokens
+        input_tokens: Number of uncached input tokens
         output_tokens: Number of output tokens
+        cache_write_tokens: Prompt tokens written to cache (1.25x input price)
+        cache_read_tokens: Prompt tokens read from cache (0.1x input price)
 
     Returns:
         Cost in USD (0.0 for free/local models)
@@ -84,7 +92,11 @@ def calculate_cost(
         return 0.0
 
     # Pricing is per 1M tokens
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
+    input_cost = (
+        input_tokens
+        + cache_write_tokens * CACHE_WRITE_MULTIPLIER
+        + cache_read_tokens * CACHE_READ_MULTIPLIER
+    ) / 1_000_000 * pricing["input"]
     output_cost = (output_tokens / 1_000_000) * pricing["output"]
 
     total = input_cost + output_cost
@@ -206,6 +218,19 @@ if __name__ == "__main__":
         print(f"FAILED: got {pricing}")
         errors += 1
 
+    # Test 7: Cache tokens priced at write/read rates, not plain input
+    print("Test 7: Cache write/read pricing...", end=" ")
+    cost = calculate_cost(
+        "claude-sonnet-4-6", input_tokens=1000, output_tokens=0,
+        cache_write_tokens=10_000, cache_read_tokens=100_000,
+    )
+    expected = (1000 + 10_000 * 1.25 + 100_000 * 0.1) / 1_000_000 * 3.0
+    if abs(cost - expected) < 1e-9:
+        print("OK")
+    else:
+        print(f"FAILED: expected {expected}, got {cost}")
+        errors += 1
+
     # Summary
     print("\n" + "=" * 60)
     if errors == 0: